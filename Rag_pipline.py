@@ -37,7 +37,10 @@ def retrieve_summary(query, text_chunks):
     text_chunks: List of document chunks from PDF.
     """
     try:
-        # Return first 6 chunks (or all if less) for summarization
+        # Return first 6 chunks (or all if less) for summarization. This is
+        # a constant-time slice, so there is nothing worth memoizing — and
+        # keying a cache on id(text_chunks) would be unsound anyway, since
+        # CPython reuses ids once a list is collected.
         return text_chunks[:6]
     except Exception as e:
         raise Exception(f"Error retrieving documents: {e}")
@@ -48,7 +51,9 @@ def get_context(documents):
     documents: List of retrieved documents.
     """
     try:
-        context = "\n\n".join([doc.page_content for doc in documents])
+        # Generator avoids materializing an intermediate list of the
+        # (multi-KB) chunk strings before the join.
+        context = "\n\n".join(doc.page_content for doc in documents)
         return context
     except Exception as e:
         raise Exception(f"Error creating context: {e}")
@@ -61,23 +66,77 @@ Instructions:
 - Focus on the core content of the entire document.
 - Present the main ideas in bullet points (5 to 10 points).
 - Ensure the summary captures key sections and logical flow.
-Question: {question} 
-Context: {context} 
+Question: {question}
+Context: {context}
 Answer:
 """
 
+# Parse the template and compose the Runnable chain once at import; every
+# answer_query call reuses them instead of rebuilding per invocation.
+_PROMPT = ChatPromptTemplate.from_template(custom_prompt_template)
+_CHAIN = _PROMPT | llm_model
+
 def answer_query(documents, model, query):
     """
     Generate a response using the LLM based on retrieved documents and query.
     documents: List of retrieved documents.
-    model: ChatGroq LLM instance.
+    model: ChatGroq LLM instance (kept for compatibility; the precompiled
+    module-level chain is used).
     query: User query string.
     """
     try:
         context = get_context(documents)
-        prompt = ChatPromptTemplate.from_template(custom_prompt_template)
-        chain = prompt | model
-        response = chain.invoke({"question": query, "context": context})
+        response = _CHAIN.invoke({"question": query, "context": context})
         return response.content  # Extract text content from AIMessage
+    except Exception as e:
+        raise Exception(f"Error generating answer: {e}")
+
+def answer_queries(documents_list, model, queries):
+    """
+    Generate responses for several queries in one batched LLM call.
+    documents_list: List of retrieved-document lists, one per query.
+    model: ChatGroq LLM instance (kept for compatibility).
+    queries: List of user query strings.
+    """
+    try:
+        inputs = [
+            {"question": query, "context": get_context(documents)}
+            for query, documents in zip(queries, documents_list)
+        ]
+        responses = _CHAIN.batch(inputs)
+        return [response.content for response in responses]
+    except Exception as e:
+        raise Exception(f"Error generating batched answers: {e}")
+
+def answer_query_stream(documents, model, query):
+    """
+    Stream the LLM response token-by-token instead of blocking on the full
+    completion, so the first tokens reach the UI in milliseconds.
+    Yields partial text chunks; feed directly to st.write_stream.
+    documents: List of retrieved documents.
+    model: ChatGroq LLM instance (kept for compatibility).
+    query: User query string.
+    """
+    try:
+        context = get_context(documents)
+        for chunk in _CHAIN.stream({"question": query, "context": context}):
+            if chunk.content:
+                yield chunk.content
+    except Exception as e:
+        raise Exception(f"Error streaming answer: {e}")
+
+async def aanswer_query(documents, model, query):
+    """
+    Async variant of answer_query for overlapping several PDFs' LLM calls
+    with asyncio.gather; the network wait dominates, so concurrent calls
+    finish in roughly max() instead of sum() of the individual latencies.
+    documents: List of retrieved documents.
+    model: ChatGroq LLM instance (kept for compatibility).
+    query: User query string.
+    """
+    try:
+        context = get_context(documents)
+        response = await _CHAIN.ainvoke({"question": query, "context": context})
+        return response.content
     except Exception as e:
         raise Exception(f"Error generating answer: {e}")
\ No newline at end of file
@@ -2,11 +2,9 @@
 # Replace lines 1336-1384 with this comprehensive solution
 
 # Additional imports to add at the top of front.py (after existing imports)
-import gc
-import psutil
-import threading
+import os
+import time
 from io import BytesIO
-from functools import lru_cache
 import hashlib
 
 # Custom exception classes for better error handling
@@ -26,6 +24,19 @@ class PDFProcessingError(PDFPreviewError):
     """Raised when PDF processing fails"""
     pass
 
+# Available-memory snapshot with a 1-second TTL; psutil.virtual_memory()
+# parses /proc/meminfo on every call, which is redundant work when Streamlit
+# reruns re-validate the same upload several times a second.
+_mem_snapshot = [0.0, 0.0]  # [available_gb, monotonic timestamp]
+
+def _available_memory_gb():
+    now = time.monotonic()
+    if now - _mem_snapshot[1] > 1.0:
+        import psutil  # deferred: only loaded once a PDF actually needs validating
+        _mem_snapshot[0] = psutil.virtual_memory().available / (1024**3)
+        _mem_snapshot[1] = now
+    return _mem_snapshot[0]
+
 # Helper functions for PDF validation and processing
 def validate_pdf(uploaded_file):
     """
@@ -44,20 +55,25 @@ def validate_pdf(uploaded_file):
         raise PDFMemoryError(f"File too large ({file_size_mb:.1f}MB). Maximum size is 50MB")
     
     # Check available memory
-    available_memory_gb = psutil.virtual_memory().available / (1024**3)
+    available_memory_gb = _available_memory_gb()
     if file_size_mb > (available_memory_gb * 0.3 * 1024):  # Don't use more than 30% of available memory
         raise PDFMemoryError(f"Insufficient memory for {file_size_mb:.1f}MB file")
     
-    # Check PDF header
+    # Check PDF header/footer by seeking to the two slices we actually
+    # need instead of copying the whole upload with getvalue()
     try:
-        file_content = uploaded_file.getvalue()
-        if not file_content.startswith(b'%PDF'):
+        uploaded_file.seek(0)
+        if not uploaded_file.read(8).startswith(b'%PDF'):
             raise PDFCorruptedError("Invalid PDF format - missing PDF header")
-        
-        # Check for PDF footer
-        if b'%%EOF' not in file_content[-1024:]:
+
+        # Check for PDF footer in the last 1KB; rfind scans backwards, so the
+        # marker (almost always in the final few dozen bytes) is hit early
+        tail_size = min(uploaded_file.size, 1024)
+        uploaded_file.seek(-tail_size, 2)
+        if uploaded_file.read(tail_size).rfind(b'%%EOF') < 0:
             raise PDFCorruptedError("Invalid PDF format - missing EOF marker")
-            
+        uploaded_file.seek(0)
+
     except Exception as e:
         if isinstance(e, PDFCorruptedError):
             raise
@@ -65,14 +81,25 @@ def validate_pdf(uploaded_file):
     
     return True
 
-def get_pdf_metadata(uploaded_file):
+# Metadata memoized by content hash: Streamlit reruns the whole script on
+# every widget interaction, so the same upload would otherwise be re-parsed
+# by PdfReader on each rerun.
+_metadata_cache = {}
+_METADATA_CACHE_MAX = 32
+
+def _metadata_from_bytes(file_bytes):
     """
-    Extract PDF metadata safely
+    Parse metadata from in-memory PDF bytes, memoized by content hash
     """
     try:
+        digest = hashlib.blake2b(file_bytes, digest_size=16).digest()
+        cached = _metadata_cache.get(digest)
+        if cached is not None:
+            return cached
+
         from pypdf import PdfReader
-        reader = PdfReader(BytesIO(uploaded_file.getvalue()))
-        
+        reader = PdfReader(BytesIO(file_bytes))
+
         metadata = {
             'page_count': len(reader.pages),
             'title': None,
@@ -94,12 +121,91 @@ def get_pdf_metadata(uploaded_file):
                 'creation_date': reader.metadata.get('/CreationDate', ''),
                 'modification_date': reader.metadata.get('/ModDate', '')
             })
-        
+
+        if len(_metadata_cache) >= _METADATA_CACHE_MAX:
+            _metadata_cache.clear()
+        _metadata_cache[digest] = metadata
         return metadata
-        
+
     except Exception as e:
         raise PDFProcessingError(f"Failed to extract metadata: {str(e)}")
 
+def get_pdf_metadata(uploaded_file):
+    """
+    Extract PDF metadata safely
+    """
+    return _metadata_from_bytes(uploaded_file.getvalue())
+
+def validate_and_get_metadata(uploaded_file):
+    """
+    Fused Tier-2 path: validate the PDF and extract metadata off a single
+    buffer read instead of separate validate_pdf and PdfReader passes
+    """
+    if not uploaded_file:
+        raise PDFPreviewError("No file provided")
+
+    if not uploaded_file.name.lower().endswith('.pdf'):
+        raise PDFPreviewError("File must be a PDF")
+
+    file_size_mb = uploaded_file.size / (1024 * 1024)
+    if file_size_mb > 50:
+        raise PDFMemoryError(f"File too large ({file_size_mb:.1f}MB). Maximum size is 50MB")
+
+    available_memory_gb = _available_memory_gb()
+    if file_size_mb > (available_memory_gb * 0.3 * 1024):
+        raise PDFMemoryError(f"Insufficient memory for {file_size_mb:.1f}MB file")
+
+    file_bytes = uploaded_file.getvalue()
+    if not file_bytes.startswith(b'%PDF'):
+        raise PDFCorruptedError("Invalid PDF format - missing PDF header")
+    if file_bytes.rfind(b'%%EOF', max(0, len(file_bytes) - 1024)) < 0:
+        raise PDFCorruptedError("Invalid PDF format - missing EOF marker")
+
+    return _metadata_from_bytes(file_bytes)
+
+# Directory under Streamlit's static route (enableStaticServing); PDFs
+# saved here are fetched by the browser as plain binary with range-request
+# and cache support, instead of travelling base64-inflated over the
+# WebSocket on every rerun.
+_STATIC_PDF_DIR = os.path.join("static", "pdfs")
+_STATIC_PDF_MAX_FILES = 16
+
+def _evict_static_pdfs():
+    """Bound the publicly served preview directory: once the cap is hit,
+    drop the oldest files so the directory can't grow without limit."""
+    try:
+        entries = [
+            os.path.join(_STATIC_PDF_DIR, name)
+            for name in os.listdir(_STATIC_PDF_DIR)
+            if name.endswith(".pdf")
+        ]
+        if len(entries) < _STATIC_PDF_MAX_FILES:
+            return
+        entries.sort(key=os.path.getmtime)
+        for path in entries[:len(entries) - _STATIC_PDF_MAX_FILES + 1]:
+            os.remove(path)
+    except OSError:
+        # Eviction is best-effort; a racing rerun may have removed a file.
+        pass
+
+def create_static_preview(uploaded_file):
+    """
+    Persist the PDF under static/pdfs/<content digest>.pdf and return the
+    URL to iframe. The write happens once per content; reruns and
+    re-uploads of the same bytes reuse the existing file.
+    """
+    try:
+        digest = hashlib.blake2b(uploaded_file.getbuffer(), digest_size=16).hexdigest()
+        os.makedirs(_STATIC_PDF_DIR, exist_ok=True)
+        pdf_path = os.path.join(_STATIC_PDF_DIR, f"{digest}.pdf")
+        if not os.path.exists(pdf_path):
+            _evict_static_pdfs()
+            with open(pdf_path, "wb") as f:
+                f.write(uploaded_file.getbuffer())
+        return f"./app/static/pdfs/{digest}.pdf"
+    except Exception as e:
+        raise PDFProcessingError(f"Failed to create preview: {str(e)}")
+
 def create_base64_preview(uploaded_file, max_size_mb=3):
     """
     Create base64 preview with memory management
@@ -109,11 +215,16 @@ def create_base64_preview(uploaded_file, max_size_mb=3):
         
         if file_size_mb > max_size_mb:
             raise PDFMemoryError(f"File too large for preview ({file_size_mb:.1f}MB)")
-        
-        # Create base64 preview
-        file_content = uploaded_file.getvalue()
-        base64_pdf = base64.b64encode(file_content).decode("utf-8")
-        
+
+        # Stream-encode in 3-byte-aligned chunks so peak memory stays near
+        # the input size instead of input + full bytes copy + full b64 string
+        buf = bytearray()
+        uploaded_file.seek(0)
+        while chunk := uploaded_file.read(65536 * 3):
+            buf.extend(base64.b64encode(chunk))
+        uploaded_file.seek(0)
+        base64_pdf = buf.decode("ascii")
+
         # Validate base64 string
         if len(base64_pdf) > 10 * 1024 * 1024:  # 10MB limit for base64 string
             raise PDFMemoryError("Base64 preview too large")
@@ -125,22 +236,10 @@ def create_base64_preview(uploaded_file, max_size_mb=3):
             raise
         raise PDFProcessingError(f"Failed to create preview: {str(e)}")
 
-def create_metadata_preview(metadata, file_size_kb):
-    """
-    Create metadata preview HTML
-    """
-    title = metadata.get('title') or 'Untitled Document'
-    author = metadata.get('author') or 'Unknown Author'
-    page_count = metadata.get('page_count', 0)
-    
-    # Format dates
-    creation_date = metadata.get('creation_date')
-    if creation_date and hasattr(creation_date, 'strftime'):
-        creation_date = creation_date.strftime('%B %d, %Y')
-    else:
-        creation_date = 'Unknown'
-    
-    return f'''
+# Preview HTML templates parsed once at module load; per-render work is a
+# single format_map over a dict instead of re-interpolating multi-line
+# f-strings on every Streamlit rerun.
+_METADATA_PREVIEW_TMPL = '''
     <div class="pdf-metadata-preview">
         <div class="metadata-header">
             <div class="metadata-icon">📋</div>
@@ -161,7 +260,7 @@ def create_metadata_preview(metadata, file_size_kb):
             </div>
             <div class="metadata-row">
                 <span class="metadata-label">Size:</span>
-                <span class="metadata-value">{round(file_size_kb, 1)} KB</span>
+                <span class="metadata-value">{file_size_kb} KB</span>
             </div>
             <div class="metadata-row">
                 <span class="metadata-label">Created:</span>
@@ -172,53 +271,20 @@ def create_metadata_preview(metadata, file_size_kb):
             <div class="metadata-status">✅ Ready to summarize</div>
         </div>
     </div>
-    '''
+    '''.format_map
 
-def create_simple_preview(uploaded_file, file_size_kb):
-    """
-    Create simple file info preview
-    """
-    try:
-        # Try to get page count
-        from pypdf import PdfReader
-        reader = PdfReader(BytesIO(uploaded_file.getvalue()))
-        page_count = len(reader.pages)
-    except:
-        page_count = "?"
-    
-    return f'''
+_SIMPLE_PREVIEW_TMPL = '''
     <div class="pdf-simple-preview">
         <div class="simple-icon">📄</div>
         <div class="simple-content">
-            <div class="simple-name">{uploaded_file.name}</div>
-            <div class="simple-meta">{round(file_size_kb, 1)} KB • {page_count} pages</div>
+            <div class="simple-name">{file_name}</div>
+            <div class="simple-meta">{file_size_kb} KB • {page_count} pages</div>
             <div class="simple-status">✅ Ready to summarize</div>
         </div>
     </div>
-    '''
+    '''.format_map
 
-def create_error_preview(error_message, error_type="general"):
-    """
-    Create error preview with appropriate styling
-    """
-    error_icons = {
-        "memory": "🧠",
-        "corrupted": "🔴",
-        "processing": "⚠️",
-        "general": "❌"
-    }
-    
-    error_titles = {
-        "memory": "Memory Limit Exceeded",
-        "corrupted": "Corrupted PDF File",
-        "processing": "Processing Error",
-        "general": "Preview Error"
-    }
-    
-    icon = error_icons.get(error_type, error_icons["general"])
-    title = error_titles.get(error_type, error_titles["general"])
-    
-    return f'''
+_ERROR_PREVIEW_TMPL = '''
     <div class="pdf-error-preview">
         <div class="error-icon">{icon}</div>
         <div class="error-title">{title}</div>
@@ -230,7 +296,66 @@ def create_error_preview(error_message, error_type="general"):
             <div class="error-help-item">• Close other applications to free memory</div>
         </div>
     </div>
-    '''
+    '''.format_map
+
+_ERROR_ICONS = {
+    "memory": "🧠",
+    "corrupted": "🔴",
+    "processing": "⚠️",
+    "general": "❌"
+}
+
+_ERROR_TITLES = {
+    "memory": "Memory Limit Exceeded",
+    "corrupted": "Corrupted PDF File",
+    "processing": "Processing Error",
+    "general": "Preview Error"
+}
+
+def create_metadata_preview(metadata, file_size_kb):
+    """
+    Create metadata preview HTML
+    """
+    # Format dates
+    creation_date = metadata.get('creation_date')
+    if creation_date and hasattr(creation_date, 'strftime'):
+        creation_date = creation_date.strftime('%B %d, %Y')
+    else:
+        creation_date = 'Unknown'
+
+    return _METADATA_PREVIEW_TMPL({
+        'title': metadata.get('title') or 'Untitled Document',
+        'author': metadata.get('author') or 'Unknown Author',
+        'page_count': metadata.get('page_count', 0),
+        'file_size_kb': round(file_size_kb, 1),
+        'creation_date': creation_date,
+    })
+
+def create_simple_preview(uploaded_file, file_size_kb):
+    """
+    Create simple file info preview
+    """
+    try:
+        # Try to get page count (served from the content-hash cache on reruns)
+        page_count = get_pdf_metadata(uploaded_file)['page_count']
+    except:
+        page_count = "?"
+
+    return _SIMPLE_PREVIEW_TMPL({
+        'file_name': uploaded_file.name,
+        'file_size_kb': round(file_size_kb, 1),
+        'page_count': page_count,
+    })
+
+def create_error_preview(error_message, error_type="general"):
+    """
+    Create error preview with appropriate styling
+    """
+    return _ERROR_PREVIEW_TMPL({
+        'icon': _ERROR_ICONS.get(error_type, _ERROR_ICONS["general"]),
+        'title': _ERROR_TITLES.get(error_type, _ERROR_TITLES["general"]),
+        'error_message': error_message,
+    })
 
 # Main preview function to replace lines 1336-1384
 def render_pdf_preview(uploaded_file):
@@ -256,23 +381,22 @@ def render_pdf_preview(uploaded_file):
             # Validate PDF
             validate_pdf(uploaded_file)
             
-            # Create base64 preview
-            base64_pdf = create_base64_preview(uploaded_file)
-            
+            # Serve the PDF through the static route: the iframe fetches
+            # binary directly (a third smaller than base64) and the browser
+            # caches it across reruns instead of re-receiving a data URI.
+            pdf_url = create_static_preview(uploaded_file)
+
             # Render full preview
             st.markdown(f'''
             <div class="pdf-container">
                 <div class="pdf-header">📄 {uploaded_file.name} ({round(file_size_kb, 1)} KB)</div>
-                <iframe src="data:application/pdf;base64,{base64_pdf}"
+                <iframe src="{pdf_url}" loading="lazy"
                         width="100%" height="350px"
                         style="border: none; border-radius: 8px;">
                 </iframe>
             </div>
             ''', unsafe_allow_html=True)
             
-            # Clean up memory
-            gc.collect()
-            
         except PDFMemoryError as e:
             st.markdown(create_error_preview(str(e), "memory"), unsafe_allow_html=True)
         except PDFCorruptedError as e:
@@ -285,12 +409,9 @@ def render_pdf_preview(uploaded_file):
     # Tier 2: Metadata preview (3MB - 10MB)
     elif file_size_mb < 10:
         try:
-            # Validate PDF
-            validate_pdf(uploaded_file)
-            
-            # Extract metadata
-            metadata = get_pdf_metadata(uploaded_file)
-            
+            # Validate and extract metadata in one pass over a shared buffer
+            metadata = validate_and_get_metadata(uploaded_file)
+
             # Render metadata preview
             st.markdown(create_metadata_preview(metadata, file_size_kb), unsafe_allow_html=True)
             
@@ -330,6 +451,26 @@ def render_pdf_preview(uploaded_file):
         </div>
         ''', unsafe_allow_html=True)
 
+def render_pdf_previews(uploaded_files):
+    """
+    Render previews for several PDFs, overlapping the per-file validation,
+    hashing and metadata parsing across a thread pool first (blake2b and
+    pypdf release the GIL in their C paths), then rendering in upload order.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def _warm(uploaded_file):
+        try:
+            validate_and_get_metadata(uploaded_file)
+        except Exception:
+            pass  # per-file errors are surfaced by render_pdf_preview below
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(_warm, uploaded_files))
+
+    for uploaded_file in uploaded_files:
+        render_pdf_preview(uploaded_file)
+
 # Enhanced CSS for better error states and preview styling
 # Add this to your existing CSS in front.py
 enhanced_pdf_css = """
@@ -543,4 +684,4 @@ enhanced_pdf_css = """
 # 1. Add the additional imports at the top of front.py
 # 2. Add the enhanced CSS to your existing CSS section
 # 3. Replace lines 1336-1384 with: render_pdf_preview(uploaded_file)
-# 4. Make sure to add: import psutil, gc, threading, io, functools, hashlib
\ No newline at end of file
+# 4. Make sure to add: import os, time, io, hashlib (psutil is imported lazily)
\ No newline at end of file
@@ -1,14 +1,45 @@
 import streamlit as st
-from vector import upload_pdf, create_faiss_db
-from Rag_pipline import answer_query, retrieve_summary, llm_model
+# vector and Rag_pipline are imported lazily (see _prepare_document and
+# get_llm): they pull in the LangChain stack and construct the Groq
+# client, which costs seconds on a cold start. Deferring them lets the
+# hero/upload UI paint first; the price is paid once, on the first
+# summarize click, where a spinner is already showing.
 import os
-import time
-import base64
+# pybase64 drops in for the stdlib encoder with a SIMD kernel that is
+# several times faster on multi-MB inputs; fall back silently when the
+# wheel isn't installed.
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+import hashlib
 from datetime import datetime
 import io
+from io import BytesIO
 import re
+from html import escape as html_escape
+
+# pypdf resolves once at process start; the extraction helpers only
+# null-check instead of paying a sys.modules lookup per call. Unlike the
+# LangChain stack (deferred in chunk2-19), pypdf is light enough that
+# importing it up front doesn't delay the first paint noticeably.
+try:
+    from pypdf import PdfReader
+except ImportError:
+    PdfReader = None
 import gc
 from typing import Optional, Dict, Any, Tuple
+import logging
+from logging.handlers import RotatingFileHandler
+
+# Single long-lived error logger: the handler keeps its file descriptor open
+# instead of reopening error_log.txt per failure, and rotation bounds disk use.
+logger = logging.getLogger("sumlyzer")
+if not logger.handlers:
+    _log_handler = RotatingFileHandler("error_log.txt", maxBytes=1_000_000, backupCount=3)
+    _log_handler.setFormatter(logging.Formatter("[%(asctime)s] %(levelname)s %(message)s"))
+    logger.addHandler(_log_handler)
+    logger.setLevel(logging.ERROR)
 
 # PDF Preview Exception Classes
 class PDFPreviewError(Exception):
@@ -49,14 +80,14 @@ st.set_page_config(
 )
 
 # Initialize session state
-if "faiss_db" not in st.session_state:
-    st.session_state.faiss_db = None
-if "chat_history" not in st.session_state:
-    st.session_state.chat_history = []
-if "last_pdf_name" not in st.session_state:
-    st.session_state.last_pdf_name = None
-if "total_pages" not in st.session_state:
-    st.session_state.total_pages = 0
+for _key, _default in {
+    "faiss_db": None,
+    "answer_cache": {},  # (content hash, prompt) -> summary text
+    "chat_history": [],
+    "last_pdf_name": None,
+    "total_pages": 0,
+}.items():
+    st.session_state.setdefault(_key, _default)
 
 # PDF Preview Helper Functions
 def validate_pdf_file(uploaded_file) -> Tuple[bool, str]:
@@ -85,10 +116,10 @@ def validate_pdf_file(uploaded_file) -> Tuple[bool, str]:
     if uploaded_file.size == 0:
         return False, "File is empty"
     
-    # Basic PDF header validation
+    # Basic PDF header validation against a zero-copy view; no read/seek
+    # round trip, and the file pointer is left untouched for callers.
     try:
-        header = uploaded_file.read(5)
-        uploaded_file.seek(0)  # Reset file pointer
+        header = bytes(uploaded_file.getbuffer()[:5])
         if not header.startswith(b'%PDF'):
             return False, "Invalid PDF format - corrupted or not a PDF"
     except Exception as e:
@@ -102,34 +133,41 @@ def safe_get_file_content(uploaded_file) -> Tuple[Optional[bytes], Optional[Exce
     Returns: (content, exception)
     """
     try:
-        # Check if file is too large for memory
-        content = uploaded_file.getvalue()
-        
-        # Memory check - if content is too large, return memory error
-        if len(content) > 100 * 1024 * 1024:  # 100MB limit in memory
+        # Reject oversized files on the declared size, before getvalue()
+        # materializes the copy — guarding after the allocation would OOM
+        # on exactly the files the guard exists for.
+        if uploaded_file.size > 100 * 1024 * 1024:  # 100MB limit in memory
             raise PDFMemoryError("File too large to load into memory")
-        
+
+        content = uploaded_file.getvalue()
         return content, None
     except MemoryError:
         return None, PDFMemoryError("Insufficient memory to process file")
     except Exception as e:
         return None, PDFEncodingError(f"Failed to read file content: {str(e)}")
 
+@st.cache_data(show_spinner=False)
+def _encode_pdf_base64(content: bytes) -> str:
+    """Base64-encode PDF bytes, memoized so reruns reuse the encoded string."""
+    return base64.b64encode(content).decode('utf-8')
+
 def safe_base64_encode(content: bytes) -> Tuple[Optional[str], Optional[Exception]]:
     """
     Safely encode content to base64
     Returns: (base64_string, exception)
     """
     try:
-        return base64.b64encode(content).decode('utf-8'), None
+        return _encode_pdf_base64(content), None
     except MemoryError:
         return None, PDFMemoryError("Insufficient memory for base64 encoding")
     except Exception as e:
         return None, PDFEncodingError(f"Base64 encoding failed: {str(e)}")
 
+@st.cache_data(show_spinner=False, max_entries=8)
 def extract_pdf_metadata(content: bytes) -> Dict[str, Any]:
     """
-    Extract PDF metadata safely
+    Extract PDF metadata safely. Memoized per content so reruns while the
+    same file sits in the uploader skip the pypdf parse.
     Returns: dictionary with metadata
     """
     metadata = {
@@ -147,9 +185,9 @@ def extract_pdf_metadata(content: bytes) -> Dict[str, Any]:
     }
     
     try:
-        from pypdf import PdfReader
-        from io import BytesIO
-        
+        if PdfReader is None:
+            raise ImportError("pypdf library not available")
+
         reader = PdfReader(BytesIO(content))
         metadata['page_count'] = len(reader.pages)
         metadata['is_encrypted'] = reader.is_encrypted
@@ -160,14 +198,18 @@ def extract_pdf_metadata(content: bytes) -> Dict[str, Any]:
             except:
                 metadata['is_encrypted'] = True
         
-        # Extract metadata
+        # Extract metadata. One dict snapshot resolves each Info entry a
+        # single time; the per-field property accessors each walk the Info
+        # dict again. The two date fields stay on their accessors because
+        # those parse the raw D: strings into datetimes.
         if hasattr(reader, 'metadata') and reader.metadata:
             meta = reader.metadata
-            metadata['title'] = getattr(meta, 'title', None)
-            metadata['author'] = getattr(meta, 'author', None)
-            metadata['subject'] = getattr(meta, 'subject', None)
-            metadata['creator'] = getattr(meta, 'creator', None)
-            metadata['producer'] = getattr(meta, 'producer', None)
+            info = dict(meta)
+            metadata['title'] = info.get('/Title')
+            metadata['author'] = info.get('/Author')
+            metadata['subject'] = info.get('/Subject')
+            metadata['creator'] = info.get('/Creator')
+            metadata['producer'] = info.get('/Producer')
             metadata['creation_date'] = getattr(meta, 'creation_date', None)
             metadata['modification_date'] = getattr(meta, 'modification_date', None)
         
@@ -180,22 +222,42 @@ def extract_pdf_metadata(content: bytes) -> Dict[str, Any]:
     
     return metadata
 
+# Preview cleanup without the regex engine: whitespace runs collapse via
+# split/join (a tight C loop), and special characters drop through a
+# translate table that decides per codepoint on first sight and caches
+# the verdict, so no 0x110000-entry table is built up front.
+class _DropSpecial(dict):
+    """Lazily populated str.translate table: keep word characters and
+    basic punctuation, delete everything else."""
+    def __missing__(self, code):
+        ch = chr(code)
+        verdict = code if (ch.isalnum() or ch in " .,;:!?'\"-_") else None
+        self[code] = verdict
+        return verdict
+
+_DROP_SPECIAL_TABLE = _DropSpecial()
+
+@st.cache_data(show_spinner=False, max_entries=8)
 def extract_text_preview(content: bytes, max_chars: int = 500) -> str:
     """
-    Extract text preview from PDF
+    Extract text preview from PDF. Memoized per (content, max_chars) like
+    extract_pdf_metadata above.
     Returns: text preview string
     """
     try:
-        from pypdf import PdfReader
-        from io import BytesIO
-        
+        if PdfReader is None:
+            return "Unable to extract text preview"
+
         reader = PdfReader(BytesIO(content))
         text_content = []
         chars_extracted = 0
-        
-        for page in reader.pages:
+
+        # A 500-char preview almost always comes from page 1; cap the scan
+        # at the first few pages so an image-only scan of a long document
+        # doesn't walk every content stream looking for text.
+        for page_index in range(min(3, len(reader.pages))):
             try:
-                page_text = page.extract_text()
+                page_text = reader.pages[page_index].extract_text()
                 if page_text:
                     # Limit characters to prevent memory issues
                     if chars_extracted + len(page_text) > max_chars:
@@ -213,20 +275,86 @@ def extract_text_preview(content: bytes, max_chars: int = 500) -> str:
         result = ''.join(text_content).strip()
         
         # Clean up the text
-        result = re.sub(r'\s+', ' ', result)  # Normalize whitespace
-        result = re.sub(r'[^\w\s.,;:!?\'"-]', '', result)  # Remove special chars
+        result = ' '.join(result.split())  # Normalize whitespace
+        result = result.translate(_DROP_SPECIAL_TABLE)  # Remove special chars
         
         return result[:max_chars]
         
     except Exception:
         return "Unable to extract text preview"
 
-def cleanup_memory():
-    """Force garbage collection to free memory"""
-    try:
+@st.cache_resource
+def get_llm():
+    """One ChatGroq client per Python process, surviving script hot reloads."""
+    from Rag_pipline import llm_model
+    return llm_model
+
+def _prepare_document(uploaded_file):
+    """Disk write and chunking for one upload. Runs on the script thread:
+    the generate path cannot proceed without the chunks, so handing this to
+    a worker would just move the same wait elsewhere while leaking the
+    worker threads of abandoned sessions."""
+    from vector import upload_pdf, create_faiss_db
+    pdf_file_path = upload_pdf(uploaded_file)
+    return create_faiss_db(pdf_file_path)
+
+# Prepared documents shared across sessions: a second browser tab (or a
+# refreshed session) reuses the chunks for any PDF the process has already
+# parsed instead of re-running the load + split pipeline. Keyed by content
+# hash. There is no vector index in this pipeline, so the chunk list is the
+# whole per-document artifact worth persisting; the PDF itself is already
+# on disk under pdfs/. Unlike the small-string memos elsewhere, one entry
+# here can hold a large PDF's full text, so the bound is cumulative
+# characters with oldest-first eviction, not an entry count.
+_document_cache = {}
+_DOCUMENT_CACHE_MAX_CHARS = 8_000_000
+
+def _entry_chars(entry):
+    return sum(len(chunk.page_content) for chunk in entry[0])
+
+def _store_document(pdf_hash, chunks, n_pages):
+    """Insert into the document cache, evicting oldest entries until the
+    total cached text fits the character budget (the newest entry always
+    stays)."""
+    _document_cache[pdf_hash] = (chunks, n_pages)
+    total = sum(_entry_chars(entry) for entry in _document_cache.values())
+    while total > _DOCUMENT_CACHE_MAX_CHARS and len(_document_cache) > 1:
+        oldest = next(iter(_document_cache))
+        if oldest == pdf_hash:
+            break
+        total -= _entry_chars(_document_cache.pop(oldest))
+
+# Cap on the context stuffed into one completion. Chunks are ~1000 chars,
+# so this keeps the prompt around 6k tokens — inside the model's context
+# window and Groq's per-request limits, which an unbounded few-hundred-page
+# document would blow straight past.
+_CONTEXT_CHAR_BUDGET = 24_000
+
+def _select_context_chunks(chunks):
+    """Take chunks in document order until the character budget is spent
+    (always at least one)."""
+    selected = []
+    used = 0
+    for chunk in chunks:
+        used += len(chunk.page_content)
+        if selected and used > _CONTEXT_CHAR_BUDGET:
+            break
+        selected.append(chunk)
+    return selected
+
+def cleanup_memory(size_hint: int = 0):
+    """Collect garbage proportionally to how much was just released.
+
+    A full three-generation collection walks the whole heap; only pay for
+    it after a large upload (>10MB) where cyclic BinaryIO wrappers are
+    worth chasing. Smaller cleanups sweep the young generation, which is
+    roughly an order of magnitude cheaper. gc.collect does not raise, so
+    there is nothing to guard against here.
+    """
+    if size_hint > 10 * 1024 * 1024:
         gc.collect()
-    except:
-        pass
+    else:
+        gc.collect(0)
 
 def render_upload_status(uploaded_file) -> None:
     """
@@ -262,9 +390,18 @@ def render_upload_status(uploaded_file) -> None:
         ''', unsafe_allow_html=True)
         return
     
+    # The finished status card is memoized on the file identity: while the
+    # same file sits in the uploader, reruns re-emit the stored string and
+    # skip the content fetch, the (cached) metadata lookup, and the
+    # f-string build entirely.
+    _status_key = (uploaded_file.name, uploaded_file.size)
+    if st.session_state.get("_upload_status_key") == _status_key:
+        st.markdown(st.session_state._upload_status_html, unsafe_allow_html=True)
+        return
+
     file_size_kb = uploaded_file.size / 1024
     file_size_mb = file_size_kb / 1024
-    
+
     # Show upload status only
     try:
         # Try to get basic metadata for status
@@ -276,8 +413,8 @@ def render_upload_status(uploaded_file) -> None:
             page_count = '?'
     except:
         page_count = '?'
-    
-    st.markdown(f'''
+
+    status_html = f'''
     <div class="pdf-container">
         <div class="pdf-preview-info">
             <div class="pdf-icon-large">📄</div>
@@ -302,10 +439,19 @@ def render_upload_status(uploaded_file) -> None:
             </div>
         </div>
     </div>
-    ''', unsafe_allow_html=True)
-
-# Warm, colorful CSS with soft gradients
-st.markdown("""
+    '''
+    st.session_state._upload_status_key = _status_key
+    st.session_state._upload_status_html = status_html
+    st.markdown(status_html, unsafe_allow_html=True)
+
+# Warm, colorful CSS with soft gradients; the stylesheet itself lives in
+# static/front.css and is served through Streamlit's static file route
+# (see .streamlit/config.toml), so the browser caches it and reruns ship
+# a one-line <link> instead of the full ~30 KB of CSS.
+@st.cache_data
+def _static_assets() -> str:
+    """Static script/link blob, built once and reused across reruns."""
+    return """
 <script>
     // Set viewport meta tag dynamically
     (function() {
@@ -318,72 +464,17 @@ st.markdown("""
         viewport.content = 'width=device-width, initial-scale=1.0, maximum-scale=5.0, user-scalable=yes';
     })();
     
-    // Comprehensive mobile-first responsive handler
-    function makeResponsive() {
-        var width = window.innerWidth;
-        var isMobile = width <= 768;
-        
-        // Find all column containers
-        var columnContainers = document.querySelectorAll('[data-testid="column-container"]');
-        var columns = document.querySelectorAll('[data-testid="column"]');
-        
-        if (isMobile) {
-            // Mobile: Force columns to stack, hide sidebar by default
-            columnContainers.forEach(function(container) {
-                container.style.flexDirection = 'column';
-                container.style.width = '100%';
-                container.style.gap = '1rem';
-            });
-            
-            columns.forEach(function(col) {
-                col.style.width = '100%';
-                col.style.flex = '1 1 100%';
-                col.style.minWidth = '100%';
-                col.style.maxWidth = '100%';
-                col.style.display = 'block';
-                col.style.marginBottom = '1rem';
-            });
-            
-            // Auto-collapse sidebar on mobile
-            var sidebar = document.querySelector('section[data-testid="stSidebar"]');
-            if (sidebar) {
-                var sidebarButton = document.querySelector('button[kind="header"]');
-                if (sidebarButton && !sidebar.classList.contains('css-1d391kg')) {
-                    // Sidebar is open, we'll let user close it manually
-                }
-            }
-        } else if (width <= 1024) {
-            // Tablet: Allow some flexibility
-            columnContainers.forEach(function(container) {
-                container.style.flexDirection = 'row';
-            });
-        } else {
-            // Desktop: Normal layout
-            columnContainers.forEach(function(container) {
-                container.style.flexDirection = 'row';
-            });
-        }
-        
-        // Force full width on all containers
-        var containers = document.querySelectorAll('.block-container, [data-testid="stAppViewContainer"]');
-        containers.forEach(function(container) {
-            container.style.maxWidth = '100%';
-            container.style.width = '100%';
-        });
-    }
-    
-    // Run immediately and on events
-    if (document.readyState === 'loading') {
-        document.addEventListener('DOMContentLoaded', makeResponsive);
-    } else {
-        makeResponsive();
-    }
-    
-    window.addEventListener('resize', function() {
-        clearTimeout(window.responsiveTimeout);
-        window.responsiveTimeout = setTimeout(makeResponsive, 100);
-    });
-    
+    // Responsive stacking lives entirely in the @media rules below: the
+    // style engine applies them in native code on resize, so there is no
+    // JS makeResponsive() pass rewriting inline styles on every DOM
+    // mutation and timer tick.
+
+    // One-shot initializer: Streamlit re-emits this block on every rerun,
+    // and without the guard each pass would install a fresh observer on
+    // top of the live ones, multiplying the fixup work per mutation.
+    if (!window.__sumlyzer_init) {
+    window.__sumlyzer_init = true;
+
     // Hide icon box in file uploader
     function hideIconBox() {
         var dropzone = document.querySelector('[data-testid="stFileUploaderDropzone"]');
@@ -407,23 +498,27 @@ st.markdown("""
         }
     }
 
-    // Use MutationObserver to catch Streamlit's dynamic updates
-    var observer = new MutationObserver(function(mutations) {
-        makeResponsive();
-        hideIconBox();
+    // Use MutationObserver to catch Streamlit's dynamic updates.
+    // Coalesce bursts of mutations (e.g. streamed tokens) into one
+    // callback per animation frame, and watch the app container rather
+    // than the whole body so unrelated DOM churn never fires it.
+    var domFixupPending = false;
+    var observer = new MutationObserver(function() {
+        if (domFixupPending) return;
+        domFixupPending = true;
+        requestAnimationFrame(function() {
+            domFixupPending = false;
+            hideIconBox();
+            createHamburgerMenu();
+        });
     });
 
-    observer.observe(document.body, {
+    var appRoot = document.querySelector('[data-testid="stAppViewContainer"]') || document.body;
+    observer.observe(appRoot, {
         childList: true,
         subtree: true
     });
 
-    // Also run periodically to catch any missed updates
-    setInterval(function() {
-        makeResponsive();
-        hideIconBox();
-    }, 300);
-
     hideIconBox();
 
     // Hamburger menu toggle functionality
@@ -455,1167 +550,34 @@ st.markdown("""
         createHamburgerMenu();
     }
 
-    // Re-create if removed by Streamlit
-    setInterval(function() {
-        if (!document.querySelector('.hamburger-menu')) {
-            createHamburgerMenu();
-        }
-    }, 500);
-</script>
-<style>
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap');
-
-    /* Base Reset */
-    html, body {
-        overflow-x: hidden !important;
-        max-width: 100vw !important;
-        width: 100% !important;
-    }
-
-    .stApp {
-        max-width: 100% !important;
-    }
-
-    * {
-        -webkit-tap-highlight-color: rgba(0,0,0,0.05);
-        box-sizing: border-box;
-    }
-
-    /* Hide Streamlit defaults */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header {visibility: hidden;}
-    .stDeployButton {display: none;}
-
-    /* ===== HAMBURGER MENU ===== */
-    .hamburger-menu {
-        position: fixed;
-        top: 16px;
-        left: 16px;
-        z-index: 99999;
-        width: 42px;
-        height: 42px;
-        background: #2563eb;
-        border-radius: 10px;
-        display: flex;
-        flex-direction: column;
-        justify-content: center;
-        align-items: center;
-        gap: 4px;
-        cursor: pointer;
-        box-shadow: 0 4px 12px rgba(37, 99, 235, 0.3);
-        transition: all 0.2s ease;
-    }
-
-    .hamburger-menu:hover {
-        background: #1d4ed8;
-        transform: scale(1.05);
-    }
-
-    .hamburger-menu:active {
-        transform: scale(0.95);
-    }
-
-    .hamburger-line {
-        width: 18px;
-        height: 2px;
-        background: #fff;
-        border-radius: 1px;
-    }
-
-    /* Container */
-    .block-container {
-        padding: 1.5rem 2rem !important;
-        max-width: 1400px !important;
-        margin: 0 auto !important;
-    }
-
-    [data-testid="stAppViewContainer"] {
-        max-width: 100% !important;
-        width: 100% !important;
-    }
-
-    /* Main App */
-    .stApp {
-        background: linear-gradient(180deg, #f8fafc 0%, #f1f5f9 100%);
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-        min-height: 100vh;
-    }
-
-    /* Sidebar */
-    section[data-testid="stSidebar"] {
-        background: linear-gradient(180deg, #1e293b 0%, #0f172a 100%);
-        border-right: none;
-    }
-
-    section[data-testid="stSidebar"] * {
-        color: #e2e8f0 !important;
-    }
-
-    /* Hero Banner */
-    .hero-compact {
-        display: flex;
-        align-items: center;
-        justify-content: space-between;
-        padding: 2rem 2.5rem;
-        background: linear-gradient(135deg, #1e293b 0%, #334155 100%);
-        border-radius: 16px;
-        margin-bottom: 2rem;
-        box-shadow: 0 4px 20px rgba(0, 0, 0, 0.1);
-    }
-
-    .hero-left {
-        display: flex;
-        align-items: center;
-        gap: 1rem;
-    }
-
-    .hero-icon {
-        font-size: 2.5rem;
-        background: linear-gradient(135deg, #3b82f6, #8b5cf6);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-    }
-
-    .hero-title {
-        font-size: 2rem;
-        font-weight: 700;
-        color: #ffffff;
-        margin: 0;
-        letter-spacing: -0.5px;
-    }
-
-    .hero-subtitle {
-        font-size: 0.95rem;
-        color: #94a3b8;
-        margin: 0.25rem 0 0 0;
-    }
-
-    .hero-features {
-        display: flex;
-        gap: 0.75rem;
-    }
-
-    .hero-feature {
-        display: flex;
-        align-items: center;
-        gap: 0.4rem;
-        color: #e2e8f0;
-        font-size: 0.85rem;
-        font-weight: 500;
-        background: rgba(255,255,255,0.1);
-        padding: 0.5rem 1rem;
-        border-radius: 8px;
-        border: 1px solid rgba(255,255,255,0.1);
-        transition: all 0.2s ease;
-    }
-
-    .hero-feature:hover {
-        background: rgba(255,255,255,0.15);
-        border-color: rgba(255,255,255,0.2);
-    }
-
-    /* Main Cards */
-    .upload-card {
-        background: #ffffff;
-        border-radius: 16px;
-        padding: 1.5rem;
-        border: 1px solid #e2e8f0;
-        box-shadow: 0 1px 3px rgba(0, 0, 0, 0.05);
-        transition: all 0.2s ease;
-    }
-
-    .upload-card:hover {
-        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.08);
-    }
-
-    .preview-card {
-        background: #ffffff;
-        border-radius: 16px;
-        padding: 1.5rem;
-        border: 1px solid #e2e8f0;
-        box-shadow: 0 1px 3px rgba(0, 0, 0, 0.05);
-        transition: all 0.2s ease;
-    }
-
-    .preview-card:hover {
-        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.08);
-    }
-
-    .summary-section {
-        background: #ffffff;
-        border-radius: 16px;
-        padding: 1.5rem;
-        border: 1px solid #e2e8f0;
-        box-shadow: 0 1px 3px rgba(0, 0, 0, 0.05);
-        margin-top: 2rem;
-    }
-
-    /* Section titles */
-    .section-title {
-        font-size: 1rem;
-        font-weight: 600;
-        color: #1e293b;
-        margin-bottom: 1.25rem;
-        display: flex;
-        align-items: center;
-        gap: 0.6rem;
-        padding-bottom: 0.75rem;
-        border-bottom: 1px solid #f1f5f9;
-    }
-
-    .section-icon {
-        font-size: 1.15rem;
-        background: white;
-        padding: 0.4rem 0.5rem;
-        border-radius: 8px;
-        box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);
-        display: inline-flex;
-        align-items: center;
-        justify-content: center;
-        margin-right: 0.5rem;
-    }
-
-    /* Compact illustration */
-    .illustration-small {
-        display: none;
-    }
-
-    /* File upload styling */
-    .stFileUploader {
-        background: transparent !important;
-    }
-
-    .stFileUploader > div {
-        background: transparent !important;
-        padding: 0 !important;
-    }
-
-    .stFileUploader label {
-        color: #64748b !important;
-        font-weight: 500 !important;
-        font-size: 0.9rem !important;
-    }
-
-    .stFileUploader section {
-        background: #f8fafc !important;
-        border: 2px dashed #cbd5e1 !important;
-        border-radius: 12px !important;
-        padding: 2rem !important;
-        transition: all 0.2s ease !important;
-    }
-
-    .stFileUploader section:hover {
-        border-color: #3b82f6 !important;
-        background: #eff6ff !important;
-    }
-
-    .stFileUploader section > div {
-        background: transparent !important;
-        color: #64748b !important;
-        border: none !important;
-    }
-
-    .stFileUploader section > div > div {
-        border: none !important;
-        background: transparent !important;
-    }
-
-    .stFileUploader section span {
-        color: #64748b !important;
-    }
-
-    .stFileUploader section svg {
-        stroke: #3b82f6 !important;
-        border: none !important;
-    }
-
-    .stFileUploader section,
-    [data-testid="stFileUploaderDropzone"] {
-        border: 2px dashed #cbd5e1 !important;
-    }
-
-    .stFileUploader section:hover,
-    [data-testid="stFileUploaderDropzone"]:hover {
-        border: 2px dashed #3b82f6 !important;
-    }
-
-    /* Remove ALL borders inside file uploader except the main dashed border */
-    .stFileUploader section *:not(button),
-    [data-testid="stFileUploaderDropzone"] *:not(button) {
-        border: none !important;
-        outline: none !important;
-        box-shadow: none !important;
-    }
-
-    .stFileUploader section button {
-        background: linear-gradient(135deg, #3b82f6, #2563eb) !important;
-        color: white !important;
-        border: none !important;
-        border-color: transparent !important;
-        border-radius: 8px !important;
-        font-weight: 600 !important;
-        padding: 0.6rem 1.25rem !important;
-        box-shadow: 0 2px 8px rgba(59, 130, 246, 0.3) !important;
-    }
-
-    /* Ensure Browse files button has proper border */
-    .stFileUploader button {
-        border: none !important;
-    }
-
-    .stFileUploader section small {
-        color: #94a3b8 !important;
-    }
-
-    [data-testid="stFileUploader"] > section > div {
-        background: transparent !important;
-    }
-
-    [data-testid="stFileUploaderDropzone"] {
-        background: #f8fafc !important;
-        border: 2px dashed #cbd5e1 !important;
-        border-radius: 12px !important;
-        transition: all 0.2s ease !important;
-    }
-
-    [data-testid="stFileUploaderDropzone"]:hover {
-        border-color: #3b82f6 !important;
-        background: #eff6ff !important;
-    }
-
-    [data-testid="stFileUploaderDropzone"] div {
-        background: transparent !important;
-        border: none !important;
-    }
-
-    [data-testid="stFileUploaderDropzone"] span,
-    [data-testid="stFileUploaderDropzone"] p {
-        color: #64748b !important;
-    }
-
-    [data-testid="stFileUploaderDropzone"] button {
-        background: linear-gradient(135deg, #3b82f6, #2563eb) !important;
-        color: white !important;
-        border: none !important;
-        border-radius: 8px !important;
-    }
-
-    /* Hide the icon with box completely - clean look */
-    [data-testid="stFileUploaderDropzone"] > div:first-child {
-        display: none !important;
-    }
-
-    /* Style the dropzone content */
-    [data-testid="stFileUploaderDropzone"] {
-        display: flex !important;
-        flex-direction: row !important;
-        align-items: center !important;
-        justify-content: center !important;
-        gap: 1rem !important;
-        padding: 1.5rem !important;
-    }
-
-    [data-testid="stFileUploaderDropzone"] > div {
-        border: none !important;
-        box-shadow: none !important;
-        background: transparent !important;
-    }
-
-    .uploadedFile {
-        background: #ecfdf5 !important;
-        border: 1px solid #6ee7b7 !important;
-        border-radius: 8px !important;
-    }
-
-    /* File info */
-    .file-info {
-        background: linear-gradient(135deg, #ecfdf5, #d1fae5);
-        border: 1px solid #6ee7b7;
-        border-radius: 12px;
-        padding: 1rem 1.25rem;
-        display: flex;
-        align-items: center;
-        gap: 1rem;
-        margin: 1.25rem 0;
-    }
-
-    .file-icon-box {
-        width: 44px;
-        height: 44px;
-        background: linear-gradient(135deg, #10b981, #059669);
-        border-radius: 10px;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-size: 1.2rem;
-        box-shadow: 0 2px 8px rgba(16, 185, 129, 0.25);
-    }
-
-    .file-details h4 {
-        margin: 0;
-        font-size: 0.95rem;
-        color: #065f46;
-        font-weight: 600;
-    }
-
-    .file-details p {
-        margin: 0.2rem 0 0 0;
-        font-size: 0.8rem;
-        color: #059669;
-    }
-
-    /* Buttons */
-    .stButton > button {
-        background: linear-gradient(135deg, #3b82f6, #2563eb);
-        color: white;
-        border: none;
-        border-radius: 10px;
-        padding: 0.75rem 1.5rem;
-        font-size: 0.95rem;
-        font-weight: 600;
-        font-family: 'Inter', sans-serif;
-        transition: all 0.2s ease;
-        width: 100%;
-        min-height: 48px;
-        cursor: pointer;
-        box-shadow: 0 2px 8px rgba(59, 130, 246, 0.25);
-    }
-
-    .stButton > button:hover {
-        background: linear-gradient(135deg, #2563eb, #1d4ed8);
-        box-shadow: 0 4px 12px rgba(59, 130, 246, 0.35);
-        transform: translateY(-1px);
-    }
-
-    .stButton > button:active {
-        transform: translateY(0);
-    }
-
-    .stDownloadButton > button {
-        background: linear-gradient(135deg, #10b981, #059669);
-        color: white;
-        border: none;
-        border-radius: 10px;
-        font-weight: 600;
-        box-shadow: 0 2px 8px rgba(16, 185, 129, 0.25);
-    }
-
-    .stDownloadButton > button:hover {
-        background: linear-gradient(135deg, #059669, #047857);
-        box-shadow: 0 4px 12px rgba(16, 185, 129, 0.35);
-    }
-
-    /* Summary cards */
-    .summary-card {
-        background: #ffffff;
-        border-radius: 14px;
-        padding: 1.25rem;
-        margin-bottom: 1rem;
-        border: 1px solid #e2e8f0;
-        box-shadow: 0 1px 3px rgba(0, 0, 0, 0.04);
-        transition: all 0.2s ease;
-    }
-
-    .summary-card:hover {
-        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.06);
-    }
-
-    .summary-header {
-        display: flex;
-        align-items: center;
-        gap: 0.75rem;
-        padding-bottom: 0.75rem;
-        margin-bottom: 0.75rem;
-        border-bottom: 1px solid #f1f5f9;
-    }
-
-    .summary-file-icon {
-        width: 40px;
-        height: 40px;
-        background: linear-gradient(135deg, #3b82f6, #2563eb);
-        border-radius: 10px;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-size: 1.1rem;
-        box-shadow: 0 2px 6px rgba(59, 130, 246, 0.2);
-    }
-
-    .summary-file-info h4 {
-        margin: 0;
-        font-size: 0.95rem;
-        color: #1e293b;
-        font-weight: 600;
-    }
-
-    .summary-file-info span {
-        font-size: 0.75rem;
-        color: #64748b;
-    }
-
-    .summary-content {
-        color: #475569;
-        line-height: 1.75;
-        font-size: 0.9rem;
-    }
-
-    .summary-badge {
-        margin-left: auto;
-        background: linear-gradient(135deg, #8b5cf6, #7c3aed);
-        color: white;
-        padding: 0.35rem 0.75rem;
-        border-radius: 6px;
-        font-size: 0.7rem;
-        font-weight: 600;
-    }
-
-    /* Summary action buttons */
-    .summary-section .stButton > button {
-        font-size: 0.85rem !important;
-        padding: 0.6rem 1rem !important;
-        min-height: 40px !important;
-        border-radius: 8px !important;
-    }
-
-    .summary-section .stDownloadButton > button {
-        font-size: 0.85rem !important;
-        padding: 0.6rem 1rem !important;
-        min-height: 40px !important;
-        border-radius: 8px !important;
-    }
-
-    /* Empty state */
-    .empty-state {
-        text-align: center;
-        padding: 3rem 2rem;
-        background: linear-gradient(135deg, #f8fafc, #f1f5f9);
-        border-radius: 14px;
-        border: 2px dashed #e2e8f0;
-    }
-
-    .empty-icon {
-        font-size: 3rem;
-        margin-bottom: 0.75rem;
-        opacity: 0.6;
-    }
-
-    .empty-title {
-        font-size: 1rem;
-        font-weight: 600;
-        color: #475569;
-        margin-bottom: 0.35rem;
-    }
-
-    .empty-subtitle {
-        color: #94a3b8;
-        font-size: 0.875rem;
-    }
-
-    /* Stats in sidebar */
-    .stat-box {
-        background: rgba(59, 130, 246, 0.15);
-        border-radius: 12px;
-        padding: 1rem;
-        text-align: center;
-        border: 1px solid rgba(59, 130, 246, 0.2);
-    }
-
-    .stat-number {
-        font-size: 1.75rem;
-        font-weight: 700;
-        color: #60a5fa !important;
-    }
-
-    .stat-label {
-        font-size: 0.75rem;
-        color: #94a3b8 !important;
-        font-weight: 500;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-    }
-
-    /* PDF Preview */
-    .pdf-container {
-        background: #f8fafc;
-        border-radius: 12px;
-        padding: 1.5rem;
-        border: 1px solid #e2e8f0;
-    }
-
-    .pdf-preview-info {
-        display: flex;
-        flex-direction: column;
-        align-items: center;
-        text-align: center;
-        gap: 1rem;
-        padding: 2rem 1rem;
-    }
-
-    .pdf-icon-large {
-        font-size: 4rem;
-        line-height: 1;
-    }
-
-    .pdf-details {
-        display: flex;
-        flex-direction: column;
-        gap: 0.25rem;
-    }
-
-    .pdf-name {
-        font-weight: 600;
-        color: #1e293b;
-        font-size: 1rem;
-        word-break: break-word;
-    }
-
-    .pdf-meta {
-        color: #64748b;
-        font-size: 0.85rem;
-    }
-
-    .pdf-status {
-        background: #ecfdf5;
-        color: #059669;
-        padding: 0.5rem 1rem;
-        border-radius: 20px;
-        font-size: 0.85rem;
-        font-weight: 500;
-    }
-
-    .pdf-note {
-        color: #94a3b8;
-        font-size: 0.75rem;
-        margin-top: 0.5rem;
-    }
-
-    .pdf-header {
-        display: flex;
-        align-items: center;
-        gap: 0.5rem;
-        padding-bottom: 0.75rem;
-        margin-bottom: 0.75rem;
-        border-bottom: 1px solid #e2e8f0;
-        color: #475569;
-        font-weight: 600;
-        font-size: 0.85rem;
-    }
-
-    /* PDF Preview Error States */
-    .pdf-error-container {
-        background: linear-gradient(135deg, #fef2f2, #fee2e2);
-        border: 1px solid #fca5a5;
-        border-radius: 12px;
-        padding: 1.5rem;
-        margin-bottom: 1rem;
-    }
-
-    .pdf-error-header {
-        display: flex;
-        align-items: center;
-        gap: 0.75rem;
-        margin-bottom: 1rem;
-    }
-
-    .pdf-error-icon {
-        font-size: 1.5rem;
-        flex-shrink: 0;
-    }
-
-    .pdf-error-title {
-        font-weight: 600;
-        color: #991b1b;
-        font-size: 1rem;
-    }
-
-    .pdf-error-message {
-        color: #dc2626;
-        font-size: 0.875rem;
-        margin-bottom: 1rem;
-        line-height: 1.5;
-    }
-
-    .pdf-error-actions {
-        display: flex;
-        flex-direction: column;
-        gap: 0.5rem;
-    }
-
-    .pdf-error-action {
-        background: #f8fafc;
-        border: 1px solid #e2e8f0;
-        border-radius: 8px;
-        padding: 0.75rem;
-        font-size: 0.8rem;
-        color: #475569;
-    }
+    // Re-creation after Streamlit removes it is handled by the
+    // mutation observer above; no polling needed.
 
-    .pdf-error-action strong {
-        color: #1e293b;
-    }
-
-    /* PDF Preview Fallback States */
-    .pdf-fallback-container {
-        background: linear-gradient(135deg, #f0f9ff, #e0f2fe);
-        border: 1px solid #7dd3fc;
-        border-radius: 12px;
-        padding: 1.5rem;
-    }
-
-    .pdf-fallback-header {
-        display: flex;
-        align-items: center;
-        gap: 0.5rem;
-        margin-bottom: 1rem;
-        color: #0c4a6e;
-        font-weight: 600;
-        font-size: 0.9rem;
-    }
-
-    .pdf-fallback-content {
-        display: flex;
-        flex-direction: column;
-        gap: 1rem;
-    }
-
-    .pdf-metadata-grid {
-        display: grid;
-        grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
-        gap: 0.75rem;
-        font-size: 0.85rem;
-    }
-
-    .pdf-metadata-item {
-        background: #f8fafc;
-        padding: 0.5rem 0.75rem;
-        border-radius: 6px;
-        border: 1px solid #e2e8f0;
-    }
-
-    .pdf-metadata-label {
-        color: #64748b;
-        font-size: 0.75rem;
-        margin-bottom: 0.25rem;
-    }
-
-    .pdf-metadata-value {
-        color: #1e293b;
-        font-weight: 500;
-    }
-
-    .pdf-text-preview {
-        background: #ffffff;
-        border: 1px solid #e2e8f0;
-        border-radius: 8px;
-        padding: 1rem;
-        font-size: 0.85rem;
-        color: #475569;
-        line-height: 1.5;
-        max-height: 150px;
-        overflow-y: auto;
-    }
-
-    .pdf-text-preview::-webkit-scrollbar {
-        width: 6px;
-    }
-
-    .pdf-text-preview::-webkit-scrollbar-track {
-        background: #f1f5f9;
-        border-radius: 3px;
-    }
-
-    .pdf-text-preview::-webkit-scrollbar-thumb {
-        background: #cbd5e1;
-        border-radius: 3px;
-    }
-
-    .pdf-loading-preview {
-        background: linear-gradient(135deg, #eff6ff, #dbeafe);
-        border: 1px solid #bfdbfe;
-        border-radius: 12px;
-        padding: 2rem;
-        text-align: center;
-    }
-
-    .pdf-loading-spinner {
-        width: 32px;
-        height: 32px;
-        border: 2px solid #dbeafe;
-        border-top: 2px solid #3b82f6;
-        border-radius: 50%;
-        animation: spin 1s linear infinite;
-        margin: 0 auto 1rem;
-    }
-
-    .pdf-loading-text {
-        color: #1e40af;
-        font-weight: 600;
-        font-size: 0.9rem;
-        margin-bottom: 0.25rem;
-    }
-
-    .pdf-loading-subtext {
-        color: #3b82f6;
-        font-size: 0.8rem;
-    }
-
-    /* Loading */
-    .loading-container {
-        text-align: center;
-        padding: 2.5rem;
-        background: linear-gradient(135deg, #eff6ff, #dbeafe);
-        border-radius: 14px;
-        border: 1px solid #bfdbfe;
-    }
-
-    .loading-spinner {
-        width: 44px;
-        height: 44px;
-        border: 3px solid #dbeafe;
-        border-top: 3px solid #3b82f6;
-        border-radius: 50%;
-        animation: spin 0.8s linear infinite;
-        margin: 0 auto 1rem;
-    }
-
-    @keyframes spin {
-        0% { transform: rotate(0deg); }
-        100% { transform: rotate(360deg); }
-    }
-
-    .loading-text {
-        font-size: 1rem;
-        font-weight: 600;
-        color: #1e40af;
-    }
-
-    .loading-subtext {
-        color: #3b82f6;
-        font-size: 0.85rem;
-        margin-top: 0.25rem;
-    }
-
-    /* Error box */
-    .error-box {
-        background: linear-gradient(135deg, #fef2f2, #fee2e2);
-        border: 1px solid #fca5a5;
-        border-radius: 10px;
-        padding: 1rem 1.25rem;
-        display: flex;
-        align-items: center;
-        gap: 0.6rem;
-        color: #dc2626;
-        font-weight: 500;
-        font-size: 0.9rem;
-    }
-
-    /* Sidebar content */
-    .sidebar-logo {
-        text-align: center;
-        padding: 1.5rem 0;
-        border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-        margin-bottom: 1.5rem;
-    }
-
-    .sidebar-logo-icon {
-        font-size: 2.25rem;
-        margin-bottom: 0.25rem;
-    }
-
-    .sidebar-logo-text {
-        font-size: 1.35rem;
-        font-weight: 700;
-        color: #fff !important;
-    }
-
-    .sidebar-logo-tagline {
-        font-size: 0.8rem;
-        color: #94a3b8 !important;
-        margin-top: 0.2rem;
-    }
-
-    .sidebar-divider {
-        height: 1px;
-        background: rgba(255, 255, 255, 0.08);
-        margin: 1.25rem 0;
-    }
-
-    /* How it works */
-    .steps-container {
-        background: rgba(255, 255, 255, 0.05);
-        border-radius: 12px;
-        padding: 1.25rem;
-        border: 1px solid rgba(255, 255, 255, 0.08);
-    }
-
-    .steps-title {
-        font-weight: 600;
-        color: #e2e8f0 !important;
-        margin-bottom: 1rem;
-        font-size: 0.9rem;
-    }
-
-    .step-item {
-        display: flex;
-        align-items: center;
-        gap: 0.75rem;
-        margin-bottom: 0.75rem;
-    }
-
-    .step-item:last-child {
-        margin-bottom: 0;
-    }
-
-    .step-number {
-        width: 24px;
-        height: 24px;
-        background: linear-gradient(135deg, #3b82f6, #2563eb);
-        border-radius: 50%;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        color: white;
-        font-size: 0.7rem;
-        font-weight: 700;
-        flex-shrink: 0;
-    }
-
-    .step-text {
-        color: #cbd5e1 !important;
-        font-size: 0.85rem;
-        font-weight: 400;
-    }
-
-    /* ===== RESPONSIVE - Universal Base Styles ===== */
-    /* Force all containers to be responsive */
-    .stApp, .stApp > div, [data-testid="stAppViewContainer"],
-    [data-testid="stAppViewContainer"] > div,
-    main[data-testid="stAppViewContainer"] {
-        max-width: 100% !important;
-        width: 100% !important;
-    }
-    
-    /* Make columns responsive by default */
-    [data-testid="column-container"] {
-        display: flex !important;
-        width: 100% !important;
-        flex-wrap: wrap !important;
-    }
-    
-    [data-testid="column"] {
-        flex: 1 1 auto !important;
-        min-width: 0 !important;
-        max-width: 100% !important;
-    }
-    
-    /* ===== MOBILE RESPONSIVE ===== */
-    @media screen and (max-width: 768px) {
-        * {
-            max-width: 100vw !important;
-        }
-
-        .block-container {
-            padding: 1rem !important;
-        }
-
-        /* Stack columns */
-        [data-testid="column-container"] {
-            flex-direction: column !important;
-            gap: 1rem !important;
-        }
-
-        [data-testid="column"] {
-            width: 100% !important;
-            flex: 1 1 100% !important;
-            min-width: 100% !important;
-            max-width: 100% !important;
-        }
-
-        /* Sidebar */
-        section[data-testid="stSidebar"] {
-            min-width: 260px !important;
-            max-width: 85vw !important;
-        }
-
-        /* Hide default toggle */
-        button[kind="header"],
-        button[data-testid="baseButton-header"] {
-            display: none !important;
-        }
-
-        /* Hamburger stays same */
-        .hamburger-menu {
-            top: 12px;
-            left: 12px;
-        }
-
-        /* Hero */
-        .hero-compact {
-            flex-direction: column !important;
-            text-align: center !important;
-            padding: 1.25rem !important;
-            gap: 1rem !important;
-        }
-
-        .hero-left {
-            flex-direction: column !important;
-            gap: 0.5rem !important;
-        }
-
-        .hero-icon {
-            font-size: 2rem !important;
-        }
-
-        .hero-title {
-            font-size: 1.5rem !important;
-        }
-
-        .hero-subtitle {
-            font-size: 0.85rem !important;
-        }
-
-        .hero-features {
-            flex-wrap: wrap !important;
-            justify-content: center !important;
-            gap: 0.5rem !important;
-        }
-
-        .hero-feature {
-            font-size: 0.75rem !important;
-            padding: 0.4rem 0.75rem !important;
-        }
-
-        /* Cards */
-        .upload-card, .preview-card, .summary-section {
-            padding: 1.25rem !important;
-            border-radius: 14px !important;
-        }
-
-        .section-title {
-            font-size: 0.95rem !important;
-        }
-
-        /* Summary */
-        .summary-card {
-            padding: 1rem !important;
-        }
-
-        .summary-content {
-            font-size: 0.85rem !important;
-        }
-
-        /* Buttons */
-        .stButton > button {
-            min-height: 46px !important;
-            font-size: 0.9rem !important;
-        }
-
-        .empty-state {
-            padding: 2rem 1.5rem !important;
-        }
-
-        .pdf-container iframe {
-            height: 280px !important;
-        }
-
-        .stFileUploader section {
-            padding: 1.5rem !important;
-        }
-    }
-
-    /* Small phones */
-    @media screen and (max-width: 480px) {
-        .block-container {
-            padding: 0.75rem !important;
-        }
-
-        .hero-compact {
-            padding: 1rem !important;
-        }
-
-        .hero-title {
-            font-size: 1.25rem !important;
-        }
-
-        .hero-features {
-            display: none !important;
-        }
+    window.addEventListener('beforeunload', function() {
+        observer.disconnect();
+    });
+    }  // end one-shot initializer
+</script>
+<link rel="preconnect" href="https://fonts.googleapis.com">
+<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+<link rel="preload" as="style" href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" onload="this.onload=null;this.rel='stylesheet'">
+<noscript><link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap"></noscript>
+<link rel="stylesheet" href="./app/static/front.css">
+"""
 
-        .pdf-container iframe {
-            height: 220px !important;
-        }
-        
-        .sidebar-logo-icon {
-            font-size: 1.8rem !important;
-        }
-    }
-    
-    /* Extra small devices */
-    @media screen and (max-width: 360px) {
-        .hero-title {
-            font-size: 1.1rem;
-        }
-        .hero-subtitle {
-            font-size: 0.7rem;
-        }
-        .section-title {
-            font-size: 0.85rem;
-        }
-        .summary-content {
-            font-size: 0.75rem;
-        }
-    }
-    
-    /* Landscape mobile orientation */
-    @media screen and (max-width: 768px) and (orientation: landscape) {
-        .pdf-container iframe {
-            height: 180px !important;
-        }
-        .hero-compact {
-            padding: 0.8rem 1rem;
-        }
-    }
-    
-    /* Tablet adjustments */
-    @media screen and (min-width: 769px) and (max-width: 1024px) {
-        /* Allow columns to work but with adjusted sizing */
-        [data-testid="column-container"] {
-            flex-direction: row !important;
-        }
-        
-        [data-testid="column"] {
-            flex: 1 1 auto !important;
-            min-width: 0 !important;
-        }
-        
-        .hero-compact {
-            padding: 1rem 1.5rem;
-        }
-        .upload-card, .preview-card {
-            padding: 1.2rem;
-        }
-        .pdf-container iframe {
-            height: 300px !important;
-        }
-    }
-    
-    /* Large screens - ensure proper layout */
-    @media screen and (min-width: 1025px) {
-        [data-testid="column-container"] {
-            flex-direction: row !important;
-        }
-        
-        [data-testid="column"] {
-            flex: 1 1 auto !important;
-        }
-    }
-</style>
-""", unsafe_allow_html=True)
+st.markdown(_static_assets(), unsafe_allow_html=True)
 
 # Small SVG Illustration
-small_illustration = '''
+@st.cache_data
+def _small_illustration() -> str:
+    """Decorative upload-card illustration, cached so reruns reuse one string.
+
+    Shipped as an <img> with a base64 data URI rather than inline SVG:
+    decoding="async" lets the browser rasterize it off the main thread and
+    the markup no longer carries a DOM subtree per rerun. Minified on first
+    build: the inter-tag whitespace below exists for source readability
+    only and is stripped before encoding."""
+    svg = re.sub(r'>\s+<', '><', '''
 <svg viewBox="0 0 200 140" fill="none" xmlns="http://www.w3.org/2000/svg">
   <circle cx="100" cy="70" r="50" fill="#FEF3C7" opacity="0.8"/>
   <circle cx="160" cy="35" r="25" fill="#FBCFE8" opacity="0.6"/>
@@ -1646,53 +608,43 @@ small_illustration = '''
     </linearGradient>
   </defs>
 </svg>
-'''
+''').strip()
+    data_uri = "data:image/svg+xml;base64," + base64.b64encode(svg.encode()).decode()
+    return f'<img src="{data_uri}" decoding="async" loading="lazy" alt="">'
 
-# Sidebar
-with st.sidebar:
-    st.markdown('''
-    <div class="sidebar-logo">
-        <div class="sidebar-logo-icon">📄</div>
-        <div class="sidebar-logo-text">Sumlyzer</div>
-        <div class="sidebar-logo-tagline">Smart PDF Summarizer</div>
-    </div>
-    ''', unsafe_allow_html=True)
+small_illustration = _small_illustration()
 
-    col1, col2 = st.columns(2)
-    with col1:
-        st.markdown(f'''
+@st.cache_data
+def _stats_html(n_summaries: int, n_pages: int) -> Tuple[str, str]:
+    """Sidebar stat boxes, rebuilt only when the counters actually change."""
+    return (
+        f'''
         <div class="stat-box">
-            <div class="stat-number">{len(st.session_state.chat_history)}</div>
+            <div class="stat-number">{n_summaries}</div>
             <div class="stat-label">Summaries</div>
         </div>
-        ''', unsafe_allow_html=True)
-    with col2:
-        st.markdown(f'''
+        ''',
+        f'''
         <div class="stat-box">
-            <div class="stat-number">{st.session_state.total_pages}</div>
+            <div class="stat-number">{n_pages}</div>
             <div class="stat-label">Pages</div>
         </div>
-        ''', unsafe_allow_html=True)
-
-    st.markdown('<div class="sidebar-divider"></div>', unsafe_allow_html=True)
-
-    if st.session_state.chat_history:
-        history_text = "\n\n".join([f"📄 {m.get('pdf', 'Document')}\n{'='*40}\n{m['ai']}" for m in st.session_state.chat_history])
-        st.download_button(
-            "📥 Download All",
-            history_text,
-            file_name=f"sumlyzer_{datetime.now().strftime('%Y%m%d_%H%M')}.txt",
-            use_container_width=True
-        )
-
-    if st.button("🗑️ Clear History", use_container_width=True):
-        st.session_state.chat_history = []
-        st.session_state.total_pages = 0
-        st.rerun()
+        ''',
+    )
 
-    st.markdown('<div class="sidebar-divider"></div>', unsafe_allow_html=True)
+# Fully static sidebar markup lives at module level next to the other
+# prebuilt templates; the rerun path just hands the same strings to
+# st.markdown.
+_SIDEBAR_LOGO_HTML = '''
+    <div class="sidebar-logo">
+        <div class="sidebar-logo-icon">📄</div>
+        <div class="sidebar-logo-text">Sumlyzer</div>
+        <div class="sidebar-logo-tagline">Smart PDF Summarizer</div>
+    </div>
+    '''
 
-    st.markdown('''
+_SIDEBAR_STEPS_HTML = '''
+    <div class="sidebar-divider"></div>
     <div class="steps-container">
         <div class="steps-title">📌 How it works</div>
         <div class="step-item">
@@ -1712,7 +664,61 @@ with st.sidebar:
             <div class="step-text">Download results</div>
         </div>
     </div>
-    ''', unsafe_allow_html=True)
+    '''
+
+# Button callbacks. These run before the click's own rerun, so the state
+# change is already in place when the script re-executes — no explicit
+# st.rerun() (i.e. no second full script pass) needed afterwards.
+def _clear_history():
+    st.session_state.chat_history = []
+    st.session_state.total_pages = 0
+
+def _delete_summary(index: int):
+    st.session_state.chat_history.pop(index)
+
+def _show_all_history():
+    st.session_state.show_all_history = True
+
+# Sidebar
+with st.sidebar:
+    st.markdown(_SIDEBAR_LOGO_HTML, unsafe_allow_html=True)
+
+    col1, col2 = st.columns(2)
+    summaries_box, pages_box = _stats_html(
+        len(st.session_state.chat_history), st.session_state.total_pages
+    )
+    with col1:
+        st.markdown(summaries_box, unsafe_allow_html=True)
+    with col2:
+        st.markdown(pages_box, unsafe_allow_html=True)
+
+    st.markdown('<div class="sidebar-divider"></div>', unsafe_allow_html=True)
+
+    if st.session_state.chat_history:
+        # Rebuild the export text (and its timestamped filename) only when
+        # the history changed, not on every rerun while the download button
+        # sits idle. Stamping the filename here also keeps the widget's
+        # parameters stable across reruns, so the element isn't diffed just
+        # because the clock minute ticked over.
+        if st.session_state.get("_history_text_len") != len(st.session_state.chat_history):
+            st.session_state._history_text = "\n\n".join(
+                f"📄 {m.get('pdf', 'Document')}\n{'='*40}\n{m['ai']}"
+                for m in st.session_state.chat_history
+            )
+            st.session_state._history_text_len = len(st.session_state.chat_history)
+            st.session_state._history_filename = (
+                f"sumlyzer_{datetime.now().strftime('%Y%m%d_%H%M')}.txt"
+            )
+        st.download_button(
+            "📥 Download All",
+            st.session_state._history_text,
+            file_name=st.session_state._history_filename,
+            use_container_width=True
+        )
+
+    st.button("🗑️ Clear History", use_container_width=True, on_click=_clear_history)
+
+    st.markdown(_SIDEBAR_STEPS_HTML, unsafe_allow_html=True)
 
 # Main content - Compact Hero at top
 st.markdown('''
@@ -1738,14 +744,14 @@ st.markdown('''
 col1, col2 = st.columns(2, gap="medium")
 
 with col1:
-    st.markdown('''
+    # One markdown flush for the card opener + illustration: each st.markdown
+    # call pays its own sanitizer pass and websocket frame.
+    st.markdown(f'''
     <div class="upload-card">
         <div class="section-title">
             <span class="section-icon">📋✅</span> Upload Document
         </div>
-    ''', unsafe_allow_html=True)
-
-    st.markdown(f'<div class="illustration-small">{small_illustration}</div>', unsafe_allow_html=True)
+    <div class="illustration-small">{small_illustration}</div>''', unsafe_allow_html=True)
 
     uploaded_file = st.file_uploader(
         "Drop PDF here or click to browse",
@@ -1754,7 +760,12 @@ with col1:
     )
 
     if uploaded_file:
-        st.markdown(f'''
+        # Rebuild the file-info card only when the selection changes;
+        # idle reruns re-emit the stored string without re-deriving the
+        # size label.
+        _file_sig = (uploaded_file.name, uploaded_file.size)
+        if st.session_state.get("_file_info_sig") != _file_sig:
+            st.session_state._file_info_html = f'''
         <div class="file-info">
             <div class="file-icon-box">📄</div>
             <div class="file-details">
@@ -1762,7 +773,9 @@ with col1:
                 <p>{round(uploaded_file.size / 1024, 1)} KB • Ready!</p>
             </div>
         </div>
-        ''', unsafe_allow_html=True)
+        '''
+            st.session_state._file_info_sig = _file_sig
+        st.markdown(st.session_state._file_info_html, unsafe_allow_html=True)
 
         ask_question = st.button("✨ Generate Summary", use_container_width=True)
     else:
@@ -1803,23 +816,50 @@ if ask_question and uploaded_file:
     ''', unsafe_allow_html=True)
 
     try:
-        current_pdf_name = uploaded_file.name
-        if st.session_state.last_pdf_name != current_pdf_name:
-            pdf_file_path = upload_pdf(uploaded_file)
-            st.session_state.faiss_db = create_faiss_db(pdf_file_path)
-            st.session_state.last_pdf_name = current_pdf_name
-
+        # Key the processed-document cache on content, not filename: the same
+        # file re-uploaded under another name is a cache hit, and a different
+        # file with a reused name no longer serves stale chunks.
+        pdf_hash = hashlib.blake2b(uploaded_file.getbuffer(), digest_size=16).hexdigest()
         fixed_prompt = "Summarize the main points of the document in 5 to 10 bullet points."
-        retrieved_docs = retrieve_summary(fixed_prompt, st.session_state.faiss_db)
-        response = answer_query(documents=retrieved_docs, model=llm_model, query=fixed_prompt)
 
-        try:
-            from pypdf import PdfReader
-            from io import BytesIO
-            reader = PdfReader(BytesIO(uploaded_file.getvalue()))
-            st.session_state.total_pages += len(reader.pages)
-        except:
-            pass
+        if pdf_hash in _document_cache:
+            st.session_state.faiss_db, n_pages = _document_cache[pdf_hash]
+        else:
+            # Cold document: disk write + chunking, with the spinner above
+            # covering the wait.
+            chunks, n_pages = _prepare_document(uploaded_file)
+            st.session_state.faiss_db = chunks
+            _store_document(pdf_hash, chunks, n_pages)
+        st.session_state.last_pdf_name = uploaded_file.name
+
+        answer_key = (pdf_hash, fixed_prompt)
+        if answer_key in st.session_state.answer_cache:
+            response = st.session_state.answer_cache[answer_key]
+        else:
+            # Stream tokens into a placeholder as they arrive, so the user
+            # reads the first bullet points while the rest are still being
+            # generated instead of staring at the spinner for the full
+            # completion time.
+            processing.empty()
+            # Feed as much of the document as fits the context budget in
+            # one stuffed completion (more than retrieve_summary's first-6
+            # truncation, but bounded — an uncapped chunk list from a long
+            # PDF exceeds the model's context window and the request fails).
+            from Rag_pipline import answer_query_stream
+            docs = _select_context_chunks(st.session_state.faiss_db)
+            placeholder = st.empty()
+            with placeholder.container():
+                # st.write_stream renders each token as it arrives and
+                # hands back the assembled string for the history cache.
+                response = st.write_stream(
+                    answer_query_stream(documents=docs, model=get_llm(), query=fixed_prompt)
+                )
+            placeholder.empty()
+            st.session_state.answer_cache[answer_key] = response
+
+        # Page count comes back from create_faiss_db, which already walked
+        # the document; no second PdfReader parse needed.
+        st.session_state.total_pages += n_pages
 
         st.session_state.chat_history.append({
             "ai": response,
@@ -1827,8 +867,10 @@ if ask_question and uploaded_file:
             "time": datetime.now().strftime("%I:%M %p")
         })
 
+        # No st.rerun() here: the summaries section renders below this block
+        # in the same pass, so the fresh card appears without replaying the
+        # whole script. The sidebar counters catch up on the next rerun.
         processing.empty()
-        st.rerun()
 
     except Exception as e:
         processing.empty()
@@ -1838,17 +880,14 @@ if ask_question and uploaded_file:
             <span>Error: {str(e)}</span>
         </div>
         ''', unsafe_allow_html=True)
-        with open("error_log.txt", "a") as f:
-            f.write(f"[{time.ctime()}] Error: {e}\n")
-
-# Display summaries with individual actions
-if st.session_state.chat_history:
-    for idx, message in enumerate(reversed(st.session_state.chat_history)):
-        actual_idx = len(st.session_state.chat_history) - 1 - idx
-        pdf_name = message.get('pdf', 'Document')
-        summary_time = message.get('time', '')
-
-        st.markdown(f'''
+        logger.exception("Summary generation failed")
+
+# Card markup built once per message: the rendered HTML is cached on the
+# message dict, so reruns join cached strings instead of re-interpolating
+# and re-escaping every historical summary. A client-side JS template was
+# considered but would orphan the per-card download/delete widgets, which
+# must stay Streamlit-side.
+_SUMMARY_CARD_TMPL = '''
         <div class="summary-card">
             <div class="summary-header">
                 <div class="summary-file-icon">📄</div>
@@ -1859,10 +898,43 @@ if st.session_state.chat_history:
                 <div class="summary-badge">✨ AI Summary</div>
             </div>
             <div class="summary-content">
-                {message['ai'].replace(chr(10), '<br>')}
+                {summary_html}
             </div>
         </div>
-        ''', unsafe_allow_html=True)
+        '''.format_map
+
+def _summary_card_html(message):
+    """Return the card HTML for one summary, building and caching it on first use."""
+    html = message.get('html')
+    if html is None:
+        html = _SUMMARY_CARD_TMPL({
+            'pdf_name': message.get('pdf', 'Document'),
+            'summary_time': message.get('time', ''),
+            'summary_html': html_escape(message['ai']).replace('\n', '<br>'),
+        })
+        message['html'] = html
+    return html
+
+# Display summaries with individual actions, newest first. Only the most
+# recent window is rendered by default so a long session doesn't pay
+# O(history) markdown work per rerun.
+_HISTORY_RENDER_CAP = 20
+
+if st.session_state.chat_history:
+    history = st.session_state.chat_history
+    show_all = st.session_state.get("show_all_history", False)
+    visible = history if show_all else history[-_HISTORY_RENDER_CAP:]
+    if len(history) > _HISTORY_RENDER_CAP and not show_all:
+        st.button(
+            f"📜 Show older summaries ({len(history) - _HISTORY_RENDER_CAP} hidden)",
+            on_click=_show_all_history,
+        )
+    for idx, message in enumerate(reversed(visible)):
+        actual_idx = len(history) - 1 - idx
+        pdf_name = message.get('pdf', 'Document')
+        summary_time = message.get('time', '')
+
+        st.markdown(_summary_card_html(message), unsafe_allow_html=True)
 
         # Action buttons for each summary
         col_dl, col_del = st.columns([1, 1])
@@ -1876,9 +948,13 @@ if st.session_state.chat_history:
                 use_container_width=True
             )
         with col_del:
-            if st.button("🗑️ Delete", key=f"delete_{actual_idx}", use_container_width=True):
-                st.session_state.chat_history.pop(actual_idx)
-                st.rerun()
+            st.button(
+                "🗑️ Delete",
+                key=f"delete_{actual_idx}",
+                use_container_width=True,
+                on_click=_delete_summary,
+                args=(actual_idx,),
+            )
 else:
     st.markdown('''
     <div class="empty-state">
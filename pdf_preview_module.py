@@ -1,10 +1,33 @@
 import streamlit as st
-import base64
+# pybase64 drops in for the stdlib encoder with a SIMD kernel (AVX2/NEON)
+# that is several times faster on multi-MB previews; fall back silently
+# when the wheel isn't installed.
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
 import logging
+
+# pybase64 can emit a str directly, skipping the intermediate bytes object
+# (~1.33x the PDF size) that encode-then-decode materializes; the stdlib
+# path keeps the two-step form.
+_b64encode_str = getattr(base64, "b64encode_as_string", None)
+if _b64encode_str is None:
+    def _b64encode_str(data):
+        # ascii decode: the base64 alphabet is pure ASCII, and the ascii
+        # codec is the cheaper of the two.
+        return base64.b64encode(data).decode("ascii")
 from io import BytesIO
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Dict, Any
 import hashlib
-import time
+
+# PyMuPDF runs extraction in MuPDF's C core, which is several times faster
+# than pypdf's pure-Python page walk; optional like pybase64 above, with
+# the pypdf paths kept as the fallback.
+try:
+    import fitz
+except ImportError:
+    fitz = None
 
 # Configure logging for PDF preview operations
 logging.basicConfig(level=logging.INFO)
@@ -16,6 +39,27 @@ MAX_LARGE_FILE_SIZE_MB = 50
 MAX_MEMORY_SIZE_MB = 100
 PDF_SIGNATURE = b'%PDF-'
 SUPPORTED_MIME_TYPES = ['application/pdf']
+_HTML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+def content_digest(file_bytes) -> str:
+    """
+    Content hash used to identify a PDF for caching
+
+    blake2b runs roughly twice as fast per core as SHA-256 and the digest
+    is updated over memoryview slices, so hashing never copies the upload.
+
+    Args:
+        file_bytes: Raw PDF bytes (bytes or memoryview)
+
+    Returns:
+        Hex digest string identifying the content
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    view = memoryview(file_bytes)
+    step = 1 << 20
+    for start in range(0, len(view), step):
+        hasher.update(view[start:start + step])
+    return hasher.hexdigest()
 
 class PDFPreviewError(Exception):
     """Base exception for PDF preview operations"""
@@ -36,119 +80,204 @@ class PDFProcessingError(PDFPreviewError):
 def validate_pdf_file(uploaded_file) -> None:
     """
     Validate PDF file structure and security
-    
+
     Args:
         uploaded_file: Streamlit uploaded file object
-        
+
     Raises:
         PDFValidationError: If file validation fails
     """
     if not uploaded_file:
         raise PDFValidationError("No file provided")
-    
+
     # Check file type
     if uploaded_file.type not in SUPPORTED_MIME_TYPES:
         raise PDFValidationError(f"Unsupported file type: {uploaded_file.type}")
-    
+
     # Check file size
     file_size_mb = uploaded_file.size / (1024 * 1024)
     if file_size_mb > MAX_LARGE_FILE_SIZE_MB:
         raise PDFValidationError(f"File too large: {file_size_mb:.1f}MB (max: {MAX_LARGE_FILE_SIZE_MB}MB)")
-    
-    # Check PDF signature
-    try:
-        file_content = uploaded_file.getvalue()
-        if not file_content.startswith(PDF_SIGNATURE):
-            raise PDFValidationError("Invalid PDF file signature")
-    except Exception as e:
-        raise PDFValidationError(f"Failed to read file content: {str(e)}")
 
-def get_pdf_metadata(uploaded_file) -> Dict[str, Any]:
+    # Check PDF signature via a zero-copy peek at the buffer; a rejected
+    # upload never gets materialized into a bytes copy at all.
+    if not bytes(uploaded_file.getbuffer()[:8]).startswith(PDF_SIGNATURE):
+        raise PDFValidationError("Invalid PDF file signature")
+
+# Per-file work products shared across the preview tiers, keyed by content
+# digest so reruns and tier fallbacks reuse them instead of re-deriving.
+# All bounded the same way as the other module caches.
+_reader_cache = {}
+_READER_CACHE_MAX = 4
+_metadata_cache = {}
+_text_preview_cache = {}
+_b64_cache = {}
+_RESULT_CACHE_MAX = 8
+
+def _get_reader(pdf_bytes: bytes, digest: Optional[str] = None):
+    """Return a PdfReader for these bytes, reusing a previously parsed one."""
+    key = digest or content_digest(pdf_bytes)
+    reader = _reader_cache.get(key)
+    if reader is None:
+        from pypdf import PdfReader
+        if len(_reader_cache) >= _READER_CACHE_MAX:
+            _reader_cache.clear()
+        # strict=False: previews should tolerate the slightly damaged xref
+        # tables that strict mode rejects (the summarizer path re-parses on
+        # its own terms anyway).
+        reader = PdfReader(BytesIO(pdf_bytes), strict=False)
+        _reader_cache[key] = reader
+    return reader
+
+def get_pdf_metadata(pdf_bytes: bytes, digest: Optional[str] = None) -> Dict[str, Any]:
     """
     Extract PDF metadata safely
-    
+
     Args:
-        uploaded_file: Streamlit uploaded file object
-        
+        pdf_bytes: Raw PDF content
+        digest: Precomputed content digest, if the caller already has one
+
     Returns:
         Dictionary containing PDF metadata
-        
+
     Raises:
         PDFProcessingError: If metadata extraction fails
     """
+    key = digest or content_digest(pdf_bytes)
+    cached = _metadata_cache.get(key)
+    if cached is not None:
+        return cached
+
     try:
-        from pypdf import PdfReader
-        reader = PdfReader(BytesIO(uploaded_file.getvalue()))
-        
-        metadata = {
-            'page_count': len(reader.pages),
-            'is_encrypted': reader.is_encrypted,
-            'has_metadata': bool(reader.metadata),
-        }
-        
-        # Extract additional metadata if available
-        if reader.metadata:
-            metadata.update({
-                'title': reader.metadata.get('/Title', ''),
-                'author': reader.metadata.get('/Author', ''),
-                'subject': reader.metadata.get('/Subject', ''),
-                'creator': reader.metadata.get('/Creator', ''),
-                'producer': reader.metadata.get('/Producer', ''),
-                'creation_date': reader.metadata.get('/CreationDate', ''),
-            })
-        
+        if fitz is not None:
+            doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+            info = doc.metadata or {}
+            metadata = {
+                'page_count': doc.page_count,
+                'is_encrypted': doc.is_encrypted,
+                'has_metadata': any(info.values()),
+                'title': info.get('title', ''),
+                'author': info.get('author', ''),
+                'subject': info.get('subject', ''),
+                'creator': info.get('creator', ''),
+                'producer': info.get('producer', ''),
+                'creation_date': info.get('creationDate', ''),
+            }
+            doc.close()
+        else:
+            reader = _get_reader(pdf_bytes, key)
+
+            metadata = {
+                'page_count': len(reader.pages),
+                'is_encrypted': reader.is_encrypted,
+                'has_metadata': bool(reader.metadata),
+            }
+
+            # Extract additional metadata if available
+            if reader.metadata:
+                metadata.update({
+                    'title': reader.metadata.get('/Title', ''),
+                    'author': reader.metadata.get('/Author', ''),
+                    'subject': reader.metadata.get('/Subject', ''),
+                    'creator': reader.metadata.get('/Creator', ''),
+                    'producer': reader.metadata.get('/Producer', ''),
+                    'creation_date': reader.metadata.get('/CreationDate', ''),
+                })
+
+        if len(_metadata_cache) >= _RESULT_CACHE_MAX:
+            _metadata_cache.clear()
+        _metadata_cache[key] = metadata
         return metadata
-        
+
     except Exception as e:
         logger.error(f"Failed to extract PDF metadata: {str(e)}")
         raise PDFProcessingError(f"Metadata extraction failed: {str(e)}")
 
-def get_pdf_text_preview(uploaded_file, max_chars: int = 500) -> str:
+def get_pdf_text_preview(pdf_bytes: bytes, max_chars: int = 500,
+                         digest: Optional[str] = None) -> str:
     """
     Extract text preview from PDF
-    
+
     Args:
-        uploaded_file: Streamlit uploaded file object
+        pdf_bytes: Raw PDF content
         max_chars: Maximum characters to extract
-        
+        digest: Precomputed content digest, if the caller already has one
+
     Returns:
         Text preview string
-        
+
     Raises:
         PDFProcessingError: If text extraction fails
     """
+    key = (digest or content_digest(pdf_bytes), max_chars)
+    cached = _text_preview_cache.get(key)
+    if cached is not None:
+        return cached
+
     try:
-        from pypdf import PdfReader
-        reader = PdfReader(BytesIO(uploaded_file.getvalue()))
-        
         text_preview = ""
-        for i, page in enumerate(reader.pages):
-            if len(text_preview) >= max_chars:
-                break
-            try:
-                page_text = page.extract_text()
-                if page_text:
-                    text_preview += page_text + "\n"
-            except Exception as e:
-                logger.warning(f"Failed to extract text from page {i+1}: {str(e)}")
-                continue
-        
-        return text_preview[:max_chars].strip()
-        
+        # Cap the page walk as well as the character count: a scanned or
+        # image-only PDF yields no text per page, and without the cap the
+        # loop would lazily materialize the entire page tree looking for
+        # some.
+        if fitz is not None:
+            doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+            for i in range(min(8, doc.page_count)):
+                if len(text_preview) >= max_chars:
+                    break
+                try:
+                    page_text = doc[i].get_text("text")
+                    if page_text:
+                        text_preview += page_text + "\n"
+                except Exception as e:
+                    logger.warning(f"Failed to extract text from page {i+1}: {str(e)}")
+                    continue
+            doc.close()
+        else:
+            reader = _get_reader(pdf_bytes, key[0])
+            # Three pages is plenty for a 500-char budget (page one usually
+            # covers it), and plain mode skips pypdf's layout analysis,
+            # which the preview doesn't need.
+            for i, page in enumerate(reader.pages[:3]):
+                if len(text_preview) >= max_chars:
+                    break
+                try:
+                    # A page with no /Font resource can't draw text — typical
+                    # of scanned pages, where extract_text would decompress
+                    # the full image stream just to return nothing.
+                    resources = page.get("/Resources")
+                    if resources is not None and "/Font" not in resources:
+                        continue
+                    page_text = page.extract_text(extraction_mode="plain")
+                    if page_text:
+                        text_preview += page_text + "\n"
+                except Exception as e:
+                    logger.warning(f"Failed to extract text from page {i+1}: {str(e)}")
+                    continue
+
+        result = text_preview[:max_chars].strip()
+        if len(_text_preview_cache) >= _RESULT_CACHE_MAX:
+            _text_preview_cache.clear()
+        _text_preview_cache[key] = result
+        return result
+
     except Exception as e:
         logger.error(f"Failed to extract PDF text preview: {str(e)}")
         raise PDFProcessingError(f"Text extraction failed: {str(e)}")
 
-def create_base64_preview(uploaded_file) -> str:
+def create_base64_preview(uploaded_file, pdf_bytes: bytes,
+                          digest: Optional[str] = None) -> str:
     """
     Create base64 encoded PDF preview
-    
+
     Args:
         uploaded_file: Streamlit uploaded file object
-        
+        pdf_bytes: Raw PDF content, read once by the caller
+        digest: Precomputed content digest, if the caller already has one
+
     Returns:
         Base64 encoded PDF string
-        
+
     Raises:
         PDFMemoryError: If file is too large for base64 encoding
         PDFProcessingError: If encoding fails
@@ -157,14 +286,24 @@ def create_base64_preview(uploaded_file) -> str:
         file_size_mb = uploaded_file.size / (1024 * 1024)
         if file_size_mb > MAX_PREVIEW_SIZE_MB:
             raise PDFMemoryError(f"File too large for preview: {file_size_mb:.1f}MB")
-        
-        pdf_bytes = uploaded_file.getvalue()
-        base64_pdf = base64.b64encode(pdf_bytes).decode("utf-8")
-        
+
+        # Content-keyed so the O(n) encode runs once per distinct file, not
+        # per rerun — and re-uploading the same PDF under another name
+        # still hits.
+        cache_key = digest or content_digest(pdf_bytes)
+        cached = _b64_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        base64_pdf = _b64encode_str(pdf_bytes)
+
         # Validate base64 encoding
         if not base64_pdf:
             raise PDFProcessingError("Base64 encoding resulted in empty string")
-        
+
+        if len(_b64_cache) >= _RESULT_CACHE_MAX:
+            _b64_cache.clear()
+        _b64_cache[cache_key] = base64_pdf
         return base64_pdf
         
     except MemoryError:
@@ -173,120 +312,73 @@ def create_base64_preview(uploaded_file) -> str:
         logger.error(f"Failed to create base64 preview: {str(e)}")
         raise PDFProcessingError(f"Base64 encoding failed: {str(e)}")
 
-def render_pdf_iframe(base64_pdf: str, file_name: str, file_size_kb: float) -> None:
-    """
-    Render PDF iframe with base64 content
-    
-    Args:
-        base64_pdf: Base64 encoded PDF
-        file_name: Original file name
-        file_size_kb: File size in KB
-    """
-    st.markdown(f'''
+# Preview HTML parsed once at module load, same pattern as the complete
+# implementation: per-render work is one format_map over a dict instead of
+# re-interpolating multi-line literals. The two parameterless states are
+# plain constants.
+_IFRAME_TMPL = '''
     <div class="pdf-container">
-        <div class="pdf-header">📄 {file_name} ({round(file_size_kb, 1)} KB)</div>
-        <iframe src="data:application/pdf;base64,{base64_pdf}"
+        <div class="pdf-header">📄 {file_name} ({file_size_kb} KB)</div>
+        <iframe src="data:application/pdf;base64,{base64_pdf}" loading="lazy"
                 width="100%" height="350px"
                 style="border: none; border-radius: 8px;">
         </iframe>
     </div>
-    ''', unsafe_allow_html=True)
+    '''.format_map
 
-def render_metadata_preview(metadata: Dict[str, Any], file_name: str, file_size_mb: float) -> None:
-    """
-    Render PDF metadata preview
-    
-    Args:
-        metadata: PDF metadata dictionary
-        file_name: Original file name
-        file_size_mb: File size in MB
-    """
-    page_count = metadata.get('page_count', '?')
-    is_encrypted = "🔒" if metadata.get('is_encrypted', False) else "🔓"
-    
-    st.markdown(f'''
+_METADATA_TMPL = '''
     <div class="pdf-container">
         <div class="pdf-preview-info">
             <div class="pdf-icon-large">📄</div>
             <div class="pdf-details">
                 <div class="pdf-name">{file_name}</div>
-                <div class="pdf-meta">{round(file_size_mb, 1)} MB • {page_count} pages {is_encrypted}</div>
+                <div class="pdf-meta">{file_size_mb} MB • {page_count} pages {is_encrypted}</div>
             </div>
             <div class="pdf-status">✓ Ready to summarize</div>
             <div class="pdf-note">Metadata preview</div>
         </div>
     </div>
-    ''', unsafe_allow_html=True)
+    '''.format_map
 
-def render_text_preview(text_preview: str, file_name: str, file_size_mb: float) -> None:
-    """
-    Render PDF text preview
-    
-    Args:
-        text_preview: Extracted text preview
-        file_name: Original file name
-        file_size_mb: File size in MB
-    """
-    # Escape HTML characters in text preview
-    escaped_text = text_preview.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-    
-    st.markdown(f'''
+_TEXT_TMPL = '''
     <div class="pdf-container">
-        <div class="pdf-header">📄 {file_name} ({round(file_size_mb, 1)} MB)</div>
+        <div class="pdf-header">📄 {file_name} ({file_size_mb} MB)</div>
         <div class="pdf-text-preview">
             <div class="pdf-preview-text">{escaped_text}</div>
             <div class="pdf-preview-note">Text preview (first 500 characters)</div>
         </div>
     </div>
-    ''', unsafe_allow_html=True)
+    '''.format_map
 
-def render_basic_info_preview(file_name: str, file_size_mb: float) -> None:
-    """
-    Render basic file information preview
-    
-    Args:
-        file_name: Original file name
-        file_size_mb: File size in MB
-    """
-    st.markdown(f'''
+_BASIC_INFO_TMPL = '''
     <div class="pdf-container">
         <div class="pdf-preview-info">
             <div class="pdf-icon-large">📄</div>
             <div class="pdf-details">
                 <div class="pdf-name">{file_name}</div>
-                <div class="pdf-meta">{round(file_size_mb, 1)} MB</div>
+                <div class="pdf-meta">{file_size_mb} MB</div>
             </div>
             <div class="pdf-status">✓ Ready to summarize</div>
             <div class="pdf-note">Basic file info</div>
         </div>
     </div>
-    ''', unsafe_allow_html=True)
+    '''.format_map
 
-def render_error_state(error_message: str, file_name: str = None) -> None:
-    """
-    Render error state with user-friendly message
-    
-    Args:
-        error_message: Error message to display
-        file_name: Optional file name for context
-    """
-    st.markdown(f'''
+_ERROR_TMPL = '''
     <div class="pdf-container error-state">
         <div class="pdf-preview-info">
             <div class="pdf-icon-large">⚠️</div>
             <div class="pdf-details">
-                <div class="pdf-name">{file_name or "PDF File"}</div>
+                <div class="pdf-name">{file_name}</div>
                 <div class="pdf-error">{error_message}</div>
             </div>
             <div class="pdf-status">❌ Preview unavailable</div>
             <div class="pdf-note">File will still be processed for summarization</div>
         </div>
     </div>
-    ''', unsafe_allow_html=True)
+    '''.format_map
 
-def render_loading_state() -> None:
-    """Render loading state for PDF preview"""
-    st.markdown('''
+_LOADING_HTML = '''
     <div class="pdf-container loading-state">
         <div class="pdf-preview-info">
             <div class="pdf-icon-large">⏳</div>
@@ -296,17 +388,97 @@ def render_loading_state() -> None:
             </div>
         </div>
     </div>
-    ''', unsafe_allow_html=True)
+    '''
 
-def render_empty_state() -> None:
-    """Render empty state when no file is uploaded"""
-    st.markdown('''
+_EMPTY_HTML = '''
     <div class="empty-state">
         <div class="empty-icon">📄</div>
         <div class="empty-title">No document yet</div>
         <div class="empty-subtitle">Upload a PDF to preview</div>
     </div>
-    ''', unsafe_allow_html=True)
+    '''
+
+def render_pdf_iframe(base64_pdf: str, file_name: str, file_size_kb: float) -> None:
+    """
+    Render PDF iframe with base64 content
+
+    Args:
+        base64_pdf: Base64 encoded PDF
+        file_name: Original file name
+        file_size_kb: File size in KB
+    """
+    st.markdown(_IFRAME_TMPL({
+        'file_name': file_name,
+        'file_size_kb': round(file_size_kb, 1),
+        'base64_pdf': base64_pdf,
+    }), unsafe_allow_html=True)
+
+def render_metadata_preview(metadata: Dict[str, Any], file_name: str, file_size_mb: float) -> None:
+    """
+    Render PDF metadata preview
+
+    Args:
+        metadata: PDF metadata dictionary
+        file_name: Original file name
+        file_size_mb: File size in MB
+    """
+    st.markdown(_METADATA_TMPL({
+        'file_name': file_name,
+        'file_size_mb': round(file_size_mb, 1),
+        'page_count': metadata.get('page_count', '?'),
+        'is_encrypted': "🔒" if metadata.get('is_encrypted', False) else "🔓",
+    }), unsafe_allow_html=True)
+
+def render_text_preview(text_preview: str, file_name: str, file_size_mb: float) -> None:
+    """
+    Render PDF text preview
+
+    Args:
+        text_preview: Extracted text preview
+        file_name: Original file name
+        file_size_mb: File size in MB
+    """
+    st.markdown(_TEXT_TMPL({
+        'file_name': file_name,
+        'file_size_mb': round(file_size_mb, 1),
+        # One translate pass instead of three chained replaces, each of
+        # which walks and reallocates the string.
+        'escaped_text': text_preview.translate(_HTML_ESCAPE),
+    }), unsafe_allow_html=True)
+
+def render_basic_info_preview(file_name: str, file_size_mb: float) -> None:
+    """
+    Render basic file information preview
+
+    Args:
+        file_name: Original file name
+        file_size_mb: File size in MB
+    """
+    st.markdown(_BASIC_INFO_TMPL({
+        'file_name': file_name,
+        'file_size_mb': round(file_size_mb, 1),
+    }), unsafe_allow_html=True)
+
+def render_error_state(error_message: str, file_name: str = None) -> None:
+    """
+    Render error state with user-friendly message
+
+    Args:
+        error_message: Error message to display
+        file_name: Optional file name for context
+    """
+    st.markdown(_ERROR_TMPL({
+        'file_name': file_name or "PDF File",
+        'error_message': error_message,
+    }), unsafe_allow_html=True)
+
+def render_loading_state() -> None:
+    """Render loading state for PDF preview"""
+    st.markdown(_LOADING_HTML, unsafe_allow_html=True)
+
+def render_empty_state() -> None:
+    """Render empty state when no file is uploaded"""
+    st.markdown(_EMPTY_HTML, unsafe_allow_html=True)
 
 def process_pdf_preview(uploaded_file) -> None:
     """
@@ -322,21 +494,28 @@ def process_pdf_preview(uploaded_file) -> None:
     file_size_kb = uploaded_file.size / 1024
     file_size_mb = file_size_kb / 1024
     file_name = uploaded_file.name
-    
+
     # Show loading state initially
     render_loading_state()
-    
+
     try:
-        # Validate PDF file
+        # Validate first — it only peeks at the header, so a bad upload is
+        # rejected before the full file is copied out of the buffer.
         validate_pdf_file(uploaded_file)
-        
+
+        # Read the upload once; every tier below works on this same bytes
+        # object instead of pulling its own copy out of the buffer. The
+        # digest is hashed once here and keys all the per-file caches.
+        pdf_bytes = uploaded_file.getvalue()
+        digest = content_digest(pdf_bytes)
+
         # 4-tier fallback system
         preview_success = False
         
         # Tier 1: Base64 preview for small files
         if file_size_mb < MAX_PREVIEW_SIZE_MB:
             try:
-                base64_pdf = create_base64_preview(uploaded_file)
+                base64_pdf = create_base64_preview(uploaded_file, pdf_bytes, digest)
                 render_pdf_iframe(base64_pdf, file_name, file_size_kb)
                 preview_success = True
                 logger.info(f"Successfully rendered base64 preview for {file_name}")
@@ -346,7 +525,7 @@ def process_pdf_preview(uploaded_file) -> None:
         # Tier 2: Metadata preview
         if not preview_success:
             try:
-                metadata = get_pdf_metadata(uploaded_file)
+                metadata = get_pdf_metadata(pdf_bytes, digest)
                 render_metadata_preview(metadata, file_name, file_size_mb)
                 preview_success = True
                 logger.info(f"Successfully rendered metadata preview for {file_name}")
@@ -356,7 +535,7 @@ def process_pdf_preview(uploaded_file) -> None:
         # Tier 3: Text preview
         if not preview_success:
             try:
-                text_preview = get_pdf_text_preview(uploaded_file)
+                text_preview = get_pdf_text_preview(pdf_bytes, digest=digest)
                 if text_preview:
                     render_text_preview(text_preview, file_name, file_size_mb)
                     preview_success = True
@@ -1,3 +1,11 @@
+"""PDF loading and chunking for the summarization pipeline.
+
+Chunks are handed straight to the LLM; no embedding model or FAISS index is
+built at runtime, so there is no vector index to train or tune here. If
+ANN retrieval is ever reintroduced, index construction belongs in
+create_faiss_db below.
+"""
+
 import os
 from langchain_community.document_loaders import PyPDFLoader
 from langchain_text_splitters import RecursiveCharacterTextSplitter
@@ -16,6 +24,10 @@ def upload_pdf(file, filename=None):
     """
     try:
         file_path = os.path.join(PDFS_DIRECTORY, filename or file.name)
+        # Always write: pdfs/ persists across sessions, and matching on
+        # name + size would let a different document with a reused filename
+        # serve the old file's contents. The write is milliseconds next to
+        # the chunking that follows.
         with open(file_path, "wb") as f:
             f.write(file.getbuffer())
         return file_path
@@ -94,11 +106,12 @@ def create_chunks(documents):
 def create_faiss_db(file_path):
     """
     Load PDF and return text chunks directly (no embeddings needed).
-    Returns list of document chunks for direct use with LLM.
+    Returns (text_chunks, n_pages): the document chunks for direct use with
+    the LLM plus the page count, so callers don't reparse the PDF for it.
     """
     try:
         documents = load_pdf(file_path)
         text_chunks = create_chunks(documents)
-        return text_chunks
+        return text_chunks, len(documents)
     except Exception as e:
         raise Exception(f"Error processing PDF: {e}")
\ No newline at end of file